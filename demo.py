@@ -3,15 +3,47 @@
 import json
 import subprocess
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from github_pr_review.analyzer import PRAnalyzer
 from github_pr_review.report_generator import ReportGenerator
 
 
-def create_sample_pr_data():
+def _sample_pr(pr_num, month, i, created, commit_type, feature):
+    """Build one sample PR dict for the given month slot."""
+    closed = created + timedelta(hours=(24 + i * 12))
+
+    # Create commit messages with conventional commit format
+    commit_messages = [
+        f"{commit_type}: implement {feature}",
+        f"{commit_type}: add tests for {feature}",
+        f"docs: update README for {feature}",
+    ]
+
+    return {
+        "number": pr_num,
+        "title": f"{commit_type}: {feature} #{pr_num}",
+        "state": "closed" if i < 4 else "open",
+        "created_at": created,
+        "closed_at": closed if i < 4 else None,
+        "merged_at": closed if i < 3 else None,
+        "merged": i < 3,
+        "author": f"user{i % 3 + 1}",
+        "description": f"Implements #{'PROJ-' + str(100 + pr_num) if i % 2 else str(month * 10 + i)}\n\nThis PR adds {feature}.",
+        "labels": ["enhancement" if i % 2 else "bug"],
+        "time_to_close_hours": (closed - created).total_seconds() / 3600 if i < 4 else None,
+        "url": f"https://github.com/demo/repo/pull/{pr_num}",
+        "additions": 50 + i * 20,
+        "deletions": 10 + i * 5,
+        "changed_files": 2 + i,
+        "commit_messages": commit_messages,
+        "repository": "demo-org/demo-repo",  # Add repository field
+    }
+
+
+def create_sample_pr_data(months=12, prs_per_month=5):
     """Create sample PR data for demonstration."""
     base_date = datetime(2024, 1, 1)
-    pr_data = []
 
     # Commit type patterns for variety
     commit_types = ["feat", "fix", "docs", "chore", "refactor", "test", "perf"]
@@ -25,44 +57,18 @@ def create_sample_pr_data():
         "search functionality"
     ]
 
-    # Generate sample PRs across the year
-    for month in range(12):
-        for i in range(5):  # 5 PRs per month
-            created = base_date + timedelta(days=month * 30 + i * 3)
-            closed = created + timedelta(hours=(24 + i * 12))
-            
-            pr_num = month * 5 + i + 1
-            commit_type = commit_types[pr_num % len(commit_types)]
-            feature = features[pr_num % len(features)]
-            
-            # Create commit messages with conventional commit format
-            commit_messages = [
-                f"{commit_type}: implement {feature}",
-                f"{commit_type}: add tests for {feature}",
-                f"docs: update README for {feature}",
-            ]
-
-            pr_data.append({
-                "number": pr_num,
-                "title": f"{commit_type}: {feature} #{pr_num}",
-                "state": "closed" if i < 4 else "open",
-                "created_at": created,
-                "closed_at": closed if i < 4 else None,
-                "merged_at": closed if i < 3 else None,
-                "merged": i < 3,
-                "author": f"user{i % 3 + 1}",
-                "description": f"Implements #{'PROJ-' + str(100 + pr_num) if i % 2 else str(month * 10 + i)}\n\nThis PR adds {feature}.",
-                "labels": ["enhancement" if i % 2 else "bug"],
-                "time_to_close_hours": (closed - created).total_seconds() / 3600 if i < 4 else None,
-                "url": f"https://github.com/demo/repo/pull/{pr_num}",
-                "additions": 50 + i * 20,
-                "deletions": 10 + i * 5,
-                "changed_files": 2 + i,
-                "commit_messages": commit_messages,
-                "repository": "demo-org/demo-repo",  # Add repository field
-            })
-
-    return pr_data
+    # Hoist everything that only depends on the slot position, so generating
+    # a scaled-up data set is a single comprehension over precomputed tables.
+    total = months * prs_per_month
+    slots = [(month, i) for month in range(months) for i in range(prs_per_month)]
+    created_dates = [base_date + timedelta(days=month * 30 + i * 3) for month, i in slots]
+    commit_type_by_num = [commit_types[pr_num % len(commit_types)] for pr_num in range(total + 1)]
+    feature_by_num = [features[pr_num % len(features)] for pr_num in range(total + 1)]
+
+    return [
+        _sample_pr(pr_num, month, i, created, commit_type_by_num[pr_num], feature_by_num[pr_num])
+        for pr_num, (month, i), created in zip(range(1, total + 1), slots, created_dates)
+    ]
 
 
 def main():
@@ -118,7 +124,7 @@ def main():
     print(f"  Total Typed Commits: {conv_commits['total_typed_commits']}")
     if conv_commits['commit_types']:
         print("  Breakdown:")
-        for commit_type, count in list(conv_commits['commit_types'].items())[:5]:  # Top 5
+        for commit_type, count in islice(conv_commits['commit_types'].items(), 5):  # Top 5
             print(f"    {commit_type}: {count}")
     if conv_commits['feat_fix_ratio']:
         print(f"  Feature/Fix Ratio: {conv_commits['feat_fix_ratio']:.2f}")
@@ -142,7 +148,9 @@ def main():
     output_dir.mkdir(exist_ok=True)
     
     raw_data_path = output_dir / "demo-org-demo-user-2024-raw-pr-data.json"
-    with open(raw_data_path, 'w') as f:
+    # Stream the encoded chunks to the file rather than holding the whole
+    # serialized dump in memory
+    with open(raw_data_path, "w") as f:
         json.dump(pr_data, f, indent=2, default=str)
     print(f"✓ Raw PR data saved: {raw_data_path}")
     print()
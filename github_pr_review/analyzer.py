@@ -1,21 +1,171 @@
 """Analyzer for PR data to extract insights and metrics."""
 
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from statistics import mean, median
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, FrozenSet, Iterable, Optional, Set, Tuple
+from statistics import fmean, median
+
+# Pattern for GitHub issue references: issue URLs and bare "#123" references,
+# matched in a single scan. Issue URLs come first so their number is consumed
+# before the bare fallback; a URL path never contains "#", so consuming it
+# cannot hide a bare reference.
+GITHUB_ISSUE_PATTERN = re.compile(r"github\.com/[\w-]+/[\w-]+/issues/(\d+)|#(\d+)")
+
+# Pattern for Jira keys. It is scanned separately from the GitHub references:
+# in the same alternation, an issue URL would consume its own path, hiding keys
+# such as PROJ-1 in github.com/MyOrg/PROJ-1/issues/3. Jira browse URLs need no
+# pattern of their own because the key they contain is found here. Keys are
+# only tried at the start of an uppercase run: a later start in the same run
+# can never succeed where the first failed, and retrying each one makes long
+# capitalised text quadratic.
+JIRA_KEY_PATTERN = re.compile(r"(?<![A-Z])[A-Z]+-\d+")
+
+# Every field the aggregation reads from a PR dict, fetched in one C-level call
+_AGGREGATE_FIELDS = itemgetter(
+    "state",
+    "merged",
+    "time_to_close_hours",
+    "author",
+    "additions",
+    "deletions",
+    "changed_files",
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_work_item_sets(description: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Extract work item references, memoized per description.
+
+    Templated and bot-generated PR bodies repeat often, so identical
+    descriptions are only scanned once.
+
+    Args:
+        description: PR description text
+
+    Returns:
+        Tuple of GitHub issue numbers and Jira ticket keys
+    """
+    # GitHub references contain a "#" or an issue URL path and Jira keys a
+    # dash, so most plain descriptions skip one or both scans entirely.
+    github_issues = set()
+    if "#" in description or "issues/" in description:
+        for url_number, number in GITHUB_ISSUE_PATTERN.findall(description):
+            github_issues.add(url_number or number)
+
+    jira_tickets = set(JIRA_KEY_PATTERN.findall(description)) if "-" in description else set()
+
+    return frozenset(github_issues), frozenset(jira_tickets)
+
+
+def _month_index(created_at: datetime) -> int:
+    """
+    Build the integer month index used to group PRs by month.
+
+    Consecutive calendar months map to consecutive integers, so grouping hashes
+    a small int instead of formatting and hashing a string per PR.
+
+    Args:
+        created_at: PR creation time
+
+    Returns:
+        Month index (year * 12 + zero-based month)
+    """
+    return created_at.year * 12 + created_at.month - 1
+
+
+def _in_month_order(monthly: Dict[int, Any]) -> Dict[str, Any]:
+    """
+    Key a mapping by YYYY-MM month string, in chronological order.
+
+    Walking the month indices from the earliest to the latest yields them in
+    order without a sort, and each key is only formatted once per month.
+
+    Args:
+        monthly: Mapping keyed by month index (see ``_month_index``)
+
+    Returns:
+        New dictionary with the same values keyed by month (YYYY-MM)
+    """
+    ordered = {}
+    if monthly:
+        for index in range(min(monthly), max(monthly) + 1):
+            if index in monthly:
+                ordered[f"{index // 12:04d}-{index % 12 + 1:02d}"] = monthly[index]
+    return ordered
+
+
+# Canonical type for every prefix PRAnalyzer.COMMIT_TYPE_PATTERN accepts,
+# including the fuzzy COMMIT_TYPE_ALIASES spellings
+_COMMIT_TYPE_PREFIXES = {
+    "feat": "feat",
+    "fix": "fix",
+    "docs": "docs",
+    "doc": "docs",
+    "hotfix": "fix",
+    "chore": "chore",
+    "refactor": "refactor",
+    "test": "test",
+    "ci": "ci",
+    "perf": "perf",
+    "style": "style",
+    "build": "build",
+    "revert": "revert",
+}
+_COMMIT_TYPE_PREFIX_MAX = max(map(len, _COMMIT_TYPE_PREFIXES))
+
+
+def _build_commit_type_index() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Group commit type prefixes by their first character in either case.
+
+    Returns:
+        Mapping of first character to (prefix, canonical type) pairs, longest
+        prefix first so "docs" is preferred over "doc"
+    """
+    index: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for prefix in sorted(_COMMIT_TYPE_PREFIXES, key=len, reverse=True):
+        entry = (prefix, _COMMIT_TYPE_PREFIXES[prefix])
+        index[prefix[0]].append(entry)
+        index[prefix[0].upper()].append(entry)
+    return {char: tuple(entries) for char, entries in index.items()}
+
+
+_COMMIT_TYPE_INDEX = _build_commit_type_index()
+
+
+@lru_cache(maxsize=4096)
+def _match_commit_type(text: str) -> Optional[str]:
+    """
+    Find the conventional commit type prefixing a title or message, memoized.
+
+    Equivalent to matching COMMIT_TYPE_PATTERN and normalizing the result, but
+    a first-character lookup rejects most non-conventional text immediately.
+    Release, merge and bot commit messages repeat heavily, so identical text
+    is only inspected once.
+
+    Args:
+        text: PR title, description or commit message
+
+    Returns:
+        Canonical commit type, or None if the text has no type prefix
+    """
+    candidates = _COMMIT_TYPE_INDEX.get(text[:1])
+    if candidates is None:
+        return None
+    head = text[:_COMMIT_TYPE_PREFIX_MAX].lower()
+    for prefix, commit_type in candidates:
+        if head.startswith(prefix):
+            return commit_type
+    return None
 
 
 class PRAnalyzer:
     """Analyzer for pull request data."""
 
-    # Patterns for work item links
-    GITHUB_ISSUE_PATTERN = re.compile(r"#(\d+)")
-    GITHUB_ISSUE_URL_PATTERN = re.compile(r"github\.com/[\w-]+/[\w-]+/issues/(\d+)")
-    JIRA_PATTERN = re.compile(r"([A-Z]+-\d+)")
-    JIRA_URL_PATTERN = re.compile(r"[a-zA-Z0-9.-]+\.atlassian\.net/browse/([A-Z]+-\d+)")
-    
     # Pattern for conventional commits
     CONVENTIONAL_COMMIT_PATTERN = re.compile(
         r'^(feat|fix|docs?|hotfix|chore|refactor|test|ci|perf|style|build|revert)(\([^)]+\))?: .+',
@@ -32,43 +182,254 @@ class PRAnalyzer:
         'hotfix': 'fix',
     }
 
-    def __init__(self, pr_data: List[Dict[str, Any]]):
+    def __init__(
+        self,
+        pr_data: List[Dict[str, Any]],
+        *,
+        _parts: Optional[
+            Tuple[List[Tuple[FrozenSet[str], FrozenSet[str]]], "_PRStats", Dict[int, "_PRStats"]]
+        ] = None,
+    ):
         """
         Initialize the analyzer with PR data.
 
         Args:
             pr_data: List of dictionaries containing PR data
+            _parts: Work item sets, overall stats and monthly stats already
+                merged for ``pr_data`` (used by ``combine``)
         """
         self.pr_data = pr_data
-    
-    def _normalize_commit_type(self, commit_type: str) -> str:
+        self._parts = _parts
+
+    @cached_property
+    def _work_items(self) -> List[Tuple[FrozenSet[str], FrozenSet[str]]]:
+        """Unsorted work item sets extracted once per PR, aligned with ``pr_data``."""
+        if self._parts is not None:
+            return self._parts[0]
+        return [_extract_work_item_sets(pr["description"]) for pr in self.pr_data]
+
+    @cached_property
+    def _aggregates(self) -> Tuple["_PRStats", Dict[int, "_PRStats"]]:
         """
-        Normalize commit type to canonical form.
-        
+        Accumulate overall and per-month statistics in a single pass.
+
+        The aggregates are computed on first use and shared by every getter.
+
+        Returns:
+            Tuple of overall stats and stats keyed by month index
+        """
+        if self._parts is not None:
+            return self._parts[1], self._parts[2]
+
+        summary = _PRStats()
+        monthly = defaultdict(_PRStats)
+
+        for pr, work_items in zip(self.pr_data, self._work_items):
+            commit_types = self.extract_conventional_commit_types(pr)
+            month_index = _month_index(pr["created_at"])
+            summary.add(pr, work_items, commit_types)
+            monthly[month_index].add(pr, work_items, commit_types)
+
+        return summary, monthly
+
+    @cached_property
+    def _monthly(self) -> Dict[str, "_PRStats"]:
+        """Per-month statistics keyed by month (YYYY-MM), in chronological order."""
+        return _in_month_order(self._aggregates[1])
+
+    @classmethod
+    def combine(cls, analyzers: Iterable["PRAnalyzer"]) -> "PRAnalyzer":
+        """
+        Build an analyzer over several analyzers' PRs by merging their statistics.
+
+        Each analyzer's aggregates are computed if needed and merged into the
+        result, so the combined PRs are not scanned a second time (e.g. the
+        aggregated analyzer built from the per-repo ones).
+
         Args:
-            commit_type: Raw commit type from regex match
-            
+            analyzers: Analyzers whose PRs make up the combined data set
+
         Returns:
-            Normalized commit type
+            Analyzer over the concatenated PR data of all analyzers
         """
-        commit_type = commit_type.lower()
-        return self.COMMIT_TYPE_ALIASES.get(commit_type, commit_type)
+        analyzers = list(analyzers)
+        summary = _PRStats()
+        monthly = defaultdict(_PRStats)
+        work_items = []
+        for analyzer in analyzers:
+            part_summary, part_monthly = analyzer._aggregates
+            summary.merge(part_summary)
+            for month_index, stats in part_monthly.items():
+                monthly[month_index].merge(stats)
+            work_items.extend(analyzer._work_items)
+
+        return cls(
+            [pr for analyzer in analyzers for pr in analyzer.pr_data],
+            _parts=(work_items, summary, monthly),
+        )
+
+    @property
+    def _summary(self) -> "_PRStats":
+        """Statistics across all PRs."""
+        return self._aggregates[0]
+
+    # Derived metrics are cached properties: the PR data is fixed, so each is
+    # computed once no matter how many times or in which order it is read.
+    # The get_* methods below are kept as thin shims for existing callers.
+
+    @cached_property
+    def total_prs(self) -> int:
+        """Total number of PRs."""
+        return len(self.pr_data)
+
+    @cached_property
+    def merged_prs_count(self) -> int:
+        """Count of merged PRs."""
+        return self._summary.merged
+
+    @cached_property
+    def closed_prs_count(self) -> int:
+        """Count of closed (but not merged) PRs."""
+        return self._summary.closed_not_merged
+
+    @cached_property
+    def open_prs_count(self) -> int:
+        """Count of still-open PRs."""
+        return self._summary.still_open
+
+    @cached_property
+    def average_time_to_close(self) -> Optional[float]:
+        """Average time to close PRs in hours, or None if no closed PRs."""
+        return self._summary.average_time_to_close()
+
+    @cached_property
+    def median_time_to_close(self) -> Optional[float]:
+        """Median time to close PRs in hours, or None if no closed PRs."""
+        times = self._summary.times
+        return median(times) if times else None
+
+    @cached_property
+    def prs_per_month(self) -> Dict[str, int]:
+        """PR count keyed by month (YYYY-MM), in chronological order."""
+        monthly = self._monthly
+        return {month: stats.total for month, stats in monthly.items()}
+
+    @cached_property
+    def prs_by_repo(self) -> Dict[str, int]:
+        """PR count per repository, most active first."""
+        return dict(self._summary.repo_counts.most_common())
+
+    @cached_property
+    def prs_by_author(self) -> Dict[str, int]:
+        """PR count per author, most active first."""
+        return dict(self._summary.author_counts.most_common())
+
+    @cached_property
+    def conventional_commits_analysis(self) -> Dict[str, Any]:
+        """Conventional commit usage across PRs."""
+        return self._summary.conventional_commits_analysis()
+
+    @cached_property
+    def code_change_stats(self) -> Dict[str, Any]:
+        """Statistics about code changes."""
+        return self._summary.code_change_stats()
+
+    @cached_property
+    def work_item_analysis(self) -> Dict[str, Any]:
+        """Statistics about work items referenced in PR descriptions."""
+        return self._summary.work_item_analysis()
+
+    @cached_property
+    def monthly_breakdown(self) -> Dict[str, Dict[str, Any]]:
+        """Detailed metrics keyed by month (YYYY-MM)."""
+        monthly = self._monthly
+
+        return {
+            month: {
+                "total_prs": stats.total,
+                "merged": stats.merged,
+                "closed_not_merged": stats.closed_not_merged,
+                "still_open": stats.still_open,
+                "avg_time_to_close_hours": stats.average_time_to_close(),
+                "work_items": stats.work_item_analysis(),
+                "code_changes": stats.code_change_stats(),
+                "conventional_commits": stats.conventional_commits_analysis(),
+                "top_authors": dict(stats.author_counts.most_common(5)),  # Top 5 contributors
+            }
+            for month, stats in monthly.items()
+        }
+
+    @cached_property
+    def business_insights(self) -> Dict[str, Any]:
+        """Business-oriented insights and cost savings metrics."""
+        # Pure arithmetic over the aggregated totals; no other report is built
+        summary = self._summary
+        commit_type_counts = summary.commit_type_counts
+        total_prs = summary.total
+        
+        # Estimate cost savings
+        # Assumptions: avg dev hourly rate, time saved per automation/fix
+        avg_hourly_rate = 75  # USD (configurable)
+        
+        # Bug fixes save approximately 4 hours of debugging/support time each
+        fix_count = commit_type_counts.get("fix", 0)
+        estimated_bug_fix_savings = fix_count * 4 * avg_hourly_rate
+        
+        # Performance improvements save ongoing operational costs
+        perf_count = commit_type_counts.get("perf", 0)
+        estimated_perf_savings = perf_count * 8 * avg_hourly_rate  # 8h per perf improvement
+        
+        # Test additions improve quality and reduce future bugs
+        test_count = commit_type_counts.get("test", 0)
+        estimated_test_savings = test_count * 2 * avg_hourly_rate  # 2h per test addition
+        
+        total_estimated_savings = (
+            estimated_bug_fix_savings + 
+            estimated_perf_savings + 
+            estimated_test_savings
+        )
+        
+        # Calculate velocity metrics
+        avg_time = self.average_time_to_close
+        velocity_score = "high" if avg_time and avg_time < 48 else "medium" if avg_time and avg_time < 168 else "low"
+        
+        return {
+            "estimated_cost_savings": {
+                "bug_fixes": estimated_bug_fix_savings,
+                "performance_improvements": estimated_perf_savings,
+                "test_additions": estimated_test_savings,
+                "total": total_estimated_savings,
+                "currency": "USD",
+            },
+            "velocity_metrics": {
+                "avg_time_to_close_hours": avg_time,
+                "velocity_score": velocity_score,
+                "total_prs": total_prs,
+                "merged_rate": (summary.merged / total_prs * 100) if total_prs else 0,
+            },
+            "productivity_metrics": {
+                "avg_lines_per_pr": (
+                    summary.additions / total_prs + summary.deletions / total_prs if total_prs else 0
+                ),
+                "total_code_changes": summary.additions + summary.deletions,
+            },
+        }
 
     def get_total_prs(self) -> int:
         """Get total number of PRs."""
-        return len(self.pr_data)
+        return self.total_prs
 
     def get_merged_prs_count(self) -> int:
         """Get count of merged PRs."""
-        return sum(1 for pr in self.pr_data if pr["merged"])
+        return self.merged_prs_count
 
     def get_closed_prs_count(self) -> int:
         """Get count of closed (but not merged) PRs."""
-        return sum(1 for pr in self.pr_data if pr["state"] == "closed" and not pr["merged"])
+        return self.closed_prs_count
 
     def get_open_prs_count(self) -> int:
         """Get count of still-open PRs."""
-        return sum(1 for pr in self.pr_data if pr["state"] == "open")
+        return self.open_prs_count
 
     def get_average_time_to_close(self) -> Optional[float]:
         """
@@ -77,8 +438,7 @@ class PRAnalyzer:
         Returns:
             Average time in hours, or None if no closed PRs
         """
-        times = [pr["time_to_close_hours"] for pr in self.pr_data if pr["time_to_close_hours"]]
-        return mean(times) if times else None
+        return self.average_time_to_close
 
     def get_median_time_to_close(self) -> Optional[float]:
         """
@@ -87,8 +447,7 @@ class PRAnalyzer:
         Returns:
             Median time in hours, or None if no closed PRs
         """
-        times = [pr["time_to_close_hours"] for pr in self.pr_data if pr["time_to_close_hours"]]
-        return median(times) if times else None
+        return self.median_time_to_close
 
     def get_prs_per_month(self) -> Dict[str, int]:
         """
@@ -97,11 +456,7 @@ class PRAnalyzer:
         Returns:
             Dictionary with month keys (YYYY-MM) and PR counts
         """
-        monthly_counts = defaultdict(int)
-        for pr in self.pr_data:
-            month_key = pr["created_at"].strftime("%Y-%m")
-            monthly_counts[month_key] += 1
-        return dict(sorted(monthly_counts.items()))
+        return self.prs_per_month
     
     def get_prs_by_repo(self) -> Dict[str, int]:
         """
@@ -110,24 +465,21 @@ class PRAnalyzer:
         Returns:
             Dictionary with repo names and their PR counts
         """
-        repo_counts = defaultdict(int)
-        for pr in self.pr_data:
-            if "repo" in pr:
-                repo_counts[pr["repo"]] += 1
-        return dict(sorted(repo_counts.items(), key=lambda x: x[1], reverse=True))
+        return self.prs_by_repo
     
-    def get_prs_by_author(self) -> Dict[str, int]:
+    def get_prs_by_author(self, top_n: Optional[int] = None) -> Dict[str, int]:
         """
         Get PR count by author.
 
+        Args:
+            top_n: Only return the N most active authors (default: all authors)
+
         Returns:
             Dictionary with author usernames and their PR counts
         """
-        author_counts = defaultdict(int)
-        for pr in self.pr_data:
-            if pr["author"]:
-                author_counts[pr["author"]] += 1
-        return dict(sorted(author_counts.items(), key=lambda x: x[1], reverse=True))
+        if top_n is None:
+            return self.prs_by_author
+        return dict(self._summary.author_counts.most_common(top_n))
 
     def extract_conventional_commit_types(self, pr: Dict[str, Any]) -> List[str]:
         """
@@ -139,25 +491,11 @@ class PRAnalyzer:
         Returns:
             List of commit types found (feat, fix, docs, etc.)
         """
-        types = []
-        
-        # Check PR title
-        title_match = self.COMMIT_TYPE_PATTERN.match(pr["title"])
-        if title_match:
-            types.append(self._normalize_commit_type(title_match.group(1)))
-        
-        # Check PR description
-        for match in self.COMMIT_TYPE_PATTERN.finditer(pr["description"]):
-            types.append(self._normalize_commit_type(match.group(1)))
-        
-        # Check commit messages
-        if "commit_messages" in pr:
-            for message in pr["commit_messages"]:
-                match = self.COMMIT_TYPE_PATTERN.match(message)
-                if match:
-                    types.append(self._normalize_commit_type(match.group(1)))
-        
-        return types
+        # Title, description (the type prefix is only recognized at its start)
+        # and commit messages are all checked the same way, so scan them in one
+        # mapped pass instead of appending match by match.
+        texts = (pr["title"], pr["description"], *pr.get("commit_messages", ()))
+        return [commit_type for commit_type in map(_match_commit_type, texts) if commit_type]
 
     def get_conventional_commits_analysis(self) -> Dict[str, Any]:
         """
@@ -166,31 +504,7 @@ class PRAnalyzer:
         Returns:
             Dictionary with conventional commit statistics
         """
-        commit_type_counts = defaultdict(int)
-        prs_with_conventional_commits = 0
-        
-        for pr in self.pr_data:
-            types = self.extract_conventional_commit_types(pr)
-            if types:
-                prs_with_conventional_commits += 1
-                for commit_type in types:
-                    commit_type_counts[commit_type] += 1
-        
-        total_types = sum(commit_type_counts.values())
-        feat_count = commit_type_counts.get("feat", 0)
-        fix_count = commit_type_counts.get("fix", 0)
-        
-        return {
-            "commit_types": dict(sorted(commit_type_counts.items(), key=lambda x: x[1], reverse=True)),
-            "prs_with_conventional_commits": prs_with_conventional_commits,
-            "percentage_with_conventional": (
-                (prs_with_conventional_commits / len(self.pr_data) * 100) if self.pr_data else 0
-            ),
-            "total_typed_commits": total_types,
-            "feat_count": feat_count,
-            "fix_count": fix_count,
-            "feat_fix_ratio": feat_count / fix_count if fix_count > 0 else None,
-        }
+        return self.conventional_commits_analysis
 
     def get_business_insights(self) -> Dict[str, Any]:
         """
@@ -199,54 +513,7 @@ class PRAnalyzer:
         Returns:
             Dictionary with business insights
         """
-        conv_commits = self.get_conventional_commits_analysis()
-        code_stats = self.get_code_change_stats()
-        
-        # Estimate cost savings
-        # Assumptions: avg dev hourly rate, time saved per automation/fix
-        avg_hourly_rate = 75  # USD (configurable)
-        
-        # Bug fixes save approximately 4 hours of debugging/support time each
-        fix_count = conv_commits.get("fix_count", 0)
-        estimated_bug_fix_savings = fix_count * 4 * avg_hourly_rate
-        
-        # Performance improvements save ongoing operational costs
-        perf_count = conv_commits.get("commit_types", {}).get("perf", 0)
-        estimated_perf_savings = perf_count * 8 * avg_hourly_rate  # 8h per perf improvement
-        
-        # Test additions improve quality and reduce future bugs
-        test_count = conv_commits.get("commit_types", {}).get("test", 0)
-        estimated_test_savings = test_count * 2 * avg_hourly_rate  # 2h per test addition
-        
-        total_estimated_savings = (
-            estimated_bug_fix_savings + 
-            estimated_perf_savings + 
-            estimated_test_savings
-        )
-        
-        # Calculate velocity metrics
-        avg_time = self.get_average_time_to_close()
-        velocity_score = "high" if avg_time and avg_time < 48 else "medium" if avg_time and avg_time < 168 else "low"
-        
-        return {
-            "estimated_cost_savings": {
-                "bug_fixes": estimated_bug_fix_savings,
-                "performance_improvements": estimated_perf_savings,
-                "test_additions": estimated_test_savings,
-                "total": total_estimated_savings,
-                "currency": "USD",
-            },
-            "velocity_metrics": {
-                "avg_time_to_close_hours": avg_time,
-                "velocity_score": velocity_score,
-                "total_prs": len(self.pr_data),
-                "merged_rate": (self.get_merged_prs_count() / len(self.pr_data) * 100) if self.pr_data else 0,
-            },
-            "productivity_metrics": {
-                "avg_lines_per_pr": code_stats["avg_additions_per_pr"] + code_stats["avg_deletions_per_pr"],
-                "total_code_changes": code_stats["total_additions"] + code_stats["total_deletions"],
-            },
-        }
+        return self.business_insights
 
     def extract_work_items(self, description: str) -> Dict[str, List[str]]:
         """
@@ -258,20 +525,11 @@ class PRAnalyzer:
         Returns:
             Dictionary with 'github_issues' and 'jira_tickets' lists
         """
-        github_issues = set()
-        jira_tickets = set()
-
-        # Find GitHub issues
-        github_issues.update(self.GITHUB_ISSUE_PATTERN.findall(description))
-        github_issues.update(self.GITHUB_ISSUE_URL_PATTERN.findall(description))
-
-        # Find Jira tickets
-        jira_tickets.update(self.JIRA_PATTERN.findall(description))
-        jira_tickets.update(self.JIRA_URL_PATTERN.findall(description))
+        github_issues, jira_tickets = _extract_work_item_sets(description)
 
         return {
-            "github_issues": sorted(list(github_issues)),
-            "jira_tickets": sorted(list(jira_tickets)),
+            "github_issues": sorted(github_issues),
+            "jira_tickets": sorted(jira_tickets),
         }
 
     def get_work_item_analysis(self) -> Dict[str, Any]:
@@ -281,26 +539,7 @@ class PRAnalyzer:
         Returns:
             Dictionary with work item statistics
         """
-        total_github_issues = set()
-        total_jira_tickets = set()
-        prs_with_work_items = 0
-
-        for pr in self.pr_data:
-            work_items = self.extract_work_items(pr["description"])
-            if work_items["github_issues"] or work_items["jira_tickets"]:
-                prs_with_work_items += 1
-            total_github_issues.update(work_items["github_issues"])
-            total_jira_tickets.update(work_items["jira_tickets"])
-
-        return {
-            "total_github_issues": len(total_github_issues),
-            "total_jira_tickets": len(total_jira_tickets),
-            "prs_with_work_items": prs_with_work_items,
-            "prs_without_work_items": len(self.pr_data) - prs_with_work_items,
-            "percentage_with_work_items": (
-                (prs_with_work_items / len(self.pr_data) * 100) if self.pr_data else 0
-            ),
-        }
+        return self.work_item_analysis
 
     def get_code_change_stats(self) -> Dict[str, Any]:
         """
@@ -309,18 +548,7 @@ class PRAnalyzer:
         Returns:
             Dictionary with code change statistics
         """
-        total_additions = sum(pr["additions"] for pr in self.pr_data)
-        total_deletions = sum(pr["deletions"] for pr in self.pr_data)
-        total_files_changed = sum(pr["changed_files"] for pr in self.pr_data)
-
-        return {
-            "total_additions": total_additions,
-            "total_deletions": total_deletions,
-            "total_files_changed": total_files_changed,
-            "avg_additions_per_pr": total_additions / len(self.pr_data) if self.pr_data else 0,
-            "avg_deletions_per_pr": total_deletions / len(self.pr_data) if self.pr_data else 0,
-            "avg_files_per_pr": total_files_changed / len(self.pr_data) if self.pr_data else 0,
-        }
+        return self.code_change_stats
 
     def get_monthly_breakdown(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -329,29 +557,171 @@ class PRAnalyzer:
         Returns:
             Dictionary with monthly statistics
         """
-        monthly_data = defaultdict(list)
-
-        # Group PRs by month
-        for pr in self.pr_data:
-            month_key = pr["created_at"].strftime("%Y-%m")
-            monthly_data[month_key].append(pr)
-
-        # Calculate metrics for each month
-        monthly_breakdown = {}
-        for month, prs in sorted(monthly_data.items()):
-            analyzer = PRAnalyzer(prs)
-            monthly_breakdown[month] = {
-                "total_prs": len(prs),
-                "merged": analyzer.get_merged_prs_count(),
-                "closed_not_merged": analyzer.get_closed_prs_count(),
-                "still_open": analyzer.get_open_prs_count(),
-                "avg_time_to_close_hours": analyzer.get_average_time_to_close(),
-                "work_items": analyzer.get_work_item_analysis(),
-                "code_changes": analyzer.get_code_change_stats(),
-                "conventional_commits": analyzer.get_conventional_commits_analysis(),
-                "top_authors": dict(
-                    list(analyzer.get_prs_by_author().items())[:5]
-                ),  # Top 5 contributors
-            }
+        return self.monthly_breakdown
+
+
+class _PRStats:
+    """Running totals for a group of pull requests."""
+
+    # One instance exists per month bucket (and per repo analyzer), so use a
+    # fixed slot layout rather than a per-instance __dict__.
+    __slots__ = (
+        "total",
+        "merged",
+        "closed_not_merged",
+        "still_open",
+        "times",
+        "additions",
+        "deletions",
+        "files_changed",
+        "github_issues",
+        "jira_tickets",
+        "prs_with_work_items",
+        "commit_type_counts",
+        "prs_with_conventional_commits",
+        "author_counts",
+        "repo_counts",
+    )
 
-        return monthly_breakdown
+    def __init__(self):
+        """Initialize empty accumulators."""
+        self.total = 0
+        self.merged = 0
+        self.closed_not_merged = 0
+        self.still_open = 0
+        self.times: List[float] = []
+        self.additions = 0
+        self.deletions = 0
+        self.files_changed = 0
+        self.github_issues: Set[str] = set()
+        self.jira_tickets: Set[str] = set()
+        self.prs_with_work_items = 0
+        self.commit_type_counts: Counter = Counter()
+        self.prs_with_conventional_commits = 0
+        self.author_counts: Counter = Counter()
+        self.repo_counts: Counter = Counter()
+
+    def add(
+        self,
+        pr: Dict[str, Any],
+        work_items: Tuple[FrozenSet[str], FrozenSet[str]],
+        commit_types: List[str],
+    ) -> None:
+        """
+        Fold a single PR into the running totals.
+
+        Args:
+            pr: PR data dictionary
+            work_items: GitHub issue and Jira ticket sets from the PR description
+            commit_types: Conventional commit types found for the PR
+        """
+        (
+            state,
+            merged,
+            time_to_close_hours,
+            author,
+            additions,
+            deletions,
+            changed_files,
+        ) = _AGGREGATE_FIELDS(pr)
+
+        self.total += 1
+
+        if merged:
+            self.merged += 1
+        elif state == "closed":
+            self.closed_not_merged += 1
+        if state == "open":
+            self.still_open += 1
+
+        if time_to_close_hours:
+            self.times.append(time_to_close_hours)
+
+        self.additions += additions
+        self.deletions += deletions
+        self.files_changed += changed_files
+
+        github_issues, jira_tickets = work_items
+        if github_issues or jira_tickets:
+            self.prs_with_work_items += 1
+        self.github_issues |= github_issues
+        self.jira_tickets |= jira_tickets
+
+        if commit_types:
+            self.prs_with_conventional_commits += 1
+            self.commit_type_counts.update(commit_types)
+
+        if author:
+            self.author_counts[author] += 1
+
+        if "repo" in pr:
+            self.repo_counts[pr["repo"]] += 1
+
+    def merge(self, other: "_PRStats") -> None:
+        """
+        Fold another group's running totals into this one.
+
+        Args:
+            other: Statistics for a disjoint group of PRs
+        """
+        self.total += other.total
+        self.merged += other.merged
+        self.closed_not_merged += other.closed_not_merged
+        self.still_open += other.still_open
+        self.times.extend(other.times)
+        self.additions += other.additions
+        self.deletions += other.deletions
+        self.files_changed += other.files_changed
+        self.github_issues |= other.github_issues
+        self.jira_tickets |= other.jira_tickets
+        self.prs_with_work_items += other.prs_with_work_items
+        self.commit_type_counts.update(other.commit_type_counts)
+        self.prs_with_conventional_commits += other.prs_with_conventional_commits
+        self.author_counts.update(other.author_counts)
+        self.repo_counts.update(other.repo_counts)
+
+    def average_time_to_close(self) -> Optional[float]:
+        """Average time to close in hours, or None if no closed PRs."""
+        return fmean(self.times) if self.times else None
+
+    def work_item_analysis(self) -> Dict[str, Any]:
+        """Work item statistics for the group."""
+        return {
+            "total_github_issues": len(self.github_issues),
+            "total_jira_tickets": len(self.jira_tickets),
+            "prs_with_work_items": self.prs_with_work_items,
+            "prs_without_work_items": self.total - self.prs_with_work_items,
+            "percentage_with_work_items": (
+                (self.prs_with_work_items / self.total * 100) if self.total else 0
+            ),
+        }
+
+    def code_change_stats(self) -> Dict[str, Any]:
+        """Code change statistics for the group."""
+        return {
+            "total_additions": self.additions,
+            "total_deletions": self.deletions,
+            "total_files_changed": self.files_changed,
+            "avg_additions_per_pr": self.additions / self.total if self.total else 0,
+            "avg_deletions_per_pr": self.deletions / self.total if self.total else 0,
+            "avg_files_per_pr": self.files_changed / self.total if self.total else 0,
+        }
+
+    def conventional_commits_analysis(self) -> Dict[str, Any]:
+        """Conventional commit statistics for the group."""
+        commit_type_counts = self.commit_type_counts
+        total_types = sum(commit_type_counts.values())
+        feat_count = commit_type_counts.get("feat", 0)
+        fix_count = commit_type_counts.get("fix", 0)
+
+        return {
+            "commit_types": dict(commit_type_counts.most_common()),
+            "prs_with_conventional_commits": self.prs_with_conventional_commits,
+            "percentage_with_conventional": (
+                (self.prs_with_conventional_commits / self.total * 100) if self.total else 0
+            ),
+            "total_typed_commits": total_types,
+            "feat_count": feat_count,
+            "fix_count": fix_count,
+            "feat_fix_ratio": feat_count / fix_count if fix_count > 0 else None,
+        }
@@ -4,6 +4,7 @@ import os
 import sys
 import json
 import click
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
@@ -12,6 +13,40 @@ from github_pr_review.github_client import GitHubPRClient
 from github_pr_review.analyzer import PRAnalyzer
 from github_pr_review.report_generator import ReportGenerator
 
+# PR fields stored as ISO 8601 strings in raw PR data files
+DATETIME_FIELDS = ("created_at", "closed_at", "merged_at")
+
+# Default number of repositories fetched concurrently; each fetch mostly waits
+# on the GitHub API, so threads overlap the network round trips
+FETCH_WORKERS = 8
+
+# Most times the fetch progress bar is redrawn, however many repositories there
+# are; steps in between are batched into the next redraw
+PROGRESS_REDRAWS = 50
+
+
+def _fetch_repo_pr_data(client, repo_name, prs, fetch_commits=True):
+    """
+    Fetch the details of a user's PRs in a single repository and extract them.
+
+    Args:
+        client: GitHubPRClient instance
+        repo_name: Repository full name (owner/name)
+        prs: The user's PRs in the repository, as found by get_user_prs_in_org
+        fetch_commits: Whether to fetch commit messages for each PR
+
+    Returns:
+        List of PR data dictionaries
+    """
+    # Batch the per-PR detail and commit lookups for the whole repo up front
+    details = client.get_pr_details(repo_name, [pr.number for pr in prs], fetch_commits=fetch_commits)
+    return [
+        client.extract_pr_data(
+            pr, repo_name, details=details.get(pr.number), fetch_commits=fetch_commits
+        )
+        for pr in prs
+    ]
+
 
 @click.command()
 @click.argument("organization")
@@ -20,7 +55,7 @@ from github_pr_review.report_generator import ReportGenerator
     "--year",
     type=int,
     help="Year to analyze (default: current year)",
-    default=None,
+    default=lambda: datetime.now().year,
 )
 @click.option(
     "--token",
@@ -29,15 +64,30 @@ from github_pr_review.report_generator import ReportGenerator
 )
 @click.option(
     "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
     help="Directory to save reports (default: ./reports)",
     default="./reports",
 )
 @click.option(
     "--pr-data-file",
+    type=click.Path(dir_okay=False, path_type=Path),
     help="Path to existing PR data JSON file (skip GitHub API calls if provided)",
     default=None,
 )
-def main(organization, user, year, token, output_dir, pr_data_file):
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    help=f"Maximum number of repositories to fetch concurrently (default: {FETCH_WORKERS})",
+    default=FETCH_WORKERS,
+)
+@click.option(
+    "--no-commits",
+    is_flag=True,
+    help="Skip fetching commit messages (faster, but commit messages are left "
+    "out of the conventional commit analysis)",
+    default=False,
+)
+def main(organization, user, year, token, output_dir, pr_data_file, max_workers, no_commits):
     """
     Generate year-in-review summary for a GitHub user's PRs across an organization.
 
@@ -69,8 +119,8 @@ def main(organization, user, year, token, output_dir, pr_data_file):
         click.echo("Alternatively, use --pr-data-file to load pre-fetched data.", err=True)
         sys.exit(1)
 
-    # Determine year for report
-    year = year if year else datetime.now().year
+    # Create the output directory once for the raw dump and reports
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     click.echo(f"Analyzing PRs for user '{user}' in organization '{organization}'")
     click.echo(f"Year: {year}")
@@ -83,74 +133,80 @@ def main(organization, user, year, token, output_dir, pr_data_file):
         if pr_data_file:
             # Load PR data from existing file
             click.echo(f"Loading PR data from {pr_data_file}...")
-            pr_data_path = Path(pr_data_file)
-            
-            if not pr_data_path.exists():
+            if not pr_data_file.exists():
                 click.echo(click.style(f"Error: File not found: {pr_data_file}", fg="red"), err=True)
                 sys.exit(1)
             
-            with open(pr_data_path, 'r') as f:
-                all_pr_data = json.load(f)
+            all_pr_data = json.loads(pr_data_file.read_bytes())
             
-            # Parse datetime strings back to datetime objects
+            # Parse datetime strings back to datetime objects (fromisoformat
+            # accepts a trailing "Z" natively since Python 3.11) and organize
+            # by repo in the same pass
+            prs_by_repo_name = defaultdict(list)
             for pr in all_pr_data:
-                if pr.get('created_at'):
-                    pr['created_at'] = datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00'))
-                if pr.get('closed_at'):
-                    pr['closed_at'] = datetime.fromisoformat(pr['closed_at'].replace('Z', '+00:00'))
-                if pr.get('merged_at'):
-                    pr['merged_at'] = datetime.fromisoformat(pr['merged_at'].replace('Z', '+00:00'))
-            
-            # Organize by repo
-            for pr in all_pr_data:
-                repo_name = pr.get('repository', 'unknown')
-                if repo_name not in pr_data_by_repo:
-                    pr_data_by_repo[repo_name] = []
-                pr_data_by_repo[repo_name].append(pr)
+                for field in DATETIME_FIELDS:
+                    value = pr.get(field)
+                    if value:
+                        pr[field] = datetime.fromisoformat(value)
+                prs_by_repo_name[pr.get('repository', 'unknown')].append(pr)
+            pr_data_by_repo = dict(prs_by_repo_name)
             
             click.echo(f"Loaded {len(all_pr_data)} pull requests across {len(pr_data_by_repo)} repositories")
             click.echo()
         else:
             # Fetch data from GitHub API
             # Initialize client
-            client = GitHubPRClient(token)
-            
-            # Get all repos where user has contributed
-            click.echo("Fetching repositories...")
-            repos = client.get_user_repos_in_org(organization, user)
+            client = GitHubPRClient(token, pool_size=max_workers)
             
-            if not repos:
-                click.echo(click.style(f"No repositories found where {user} has contributed.", fg="yellow"))
+            # Find the user's PRs in every repo with a single search
+            click.echo("Searching for pull requests...")
+            prs_by_repo_name = client.get_user_prs_in_org(organization, user, year)
+
+            if not prs_by_repo_name:
+                click.echo(click.style(f"No pull requests found for {user} in {year}.", fg="yellow"))
                 return
 
-            click.echo(f"Found {len(repos)} repositories with contributions")
+            repo_names = list(prs_by_repo_name)
+            click.echo(f"Found {len(repo_names)} repositories with contributions")
             click.echo()
 
-            # Fetch PRs from all repos
-            with click.progressbar(repos, label="Fetching PRs from repositories") as bar:
-                for repo in bar:
-                    repo_name = repo.full_name
-                    prs = client.get_prs_for_user_in_repo(repo, user, year)
-                    
-                    if prs:
-                        pr_data = [client.extract_pr_data(pr, repo_name) for pr in prs]
-                        pr_data_by_repo[repo_name] = pr_data
-                        all_pr_data.extend(pr_data)
-
-            if not all_pr_data:
-                click.echo(click.style(f"No pull requests found for {user} in {year}.", fg="yellow"))
-                return
+            # Fetch PR details from all repos concurrently, since each fetch is I/O bound
+            fetched = [None] * len(repo_names)
+            with click.progressbar(
+                length=len(repo_names),
+                label="Fetching PRs from repositories",
+                update_min_steps=max(1, len(repo_names) // PROGRESS_REDRAWS),
+            ) as bar:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(
+                            _fetch_repo_pr_data,
+                            client,
+                            repo_name,
+                            prs_by_repo_name[repo_name],
+                            fetch_commits=not no_commits,
+                        ): index
+                        for index, repo_name in enumerate(repo_names)
+                    }
+                    for future in as_completed(futures):
+                        fetched[futures[future]] = future.result()
+                        bar.update(1)
+
+            # Collect in repository order so reports don't depend on completion order
+            for repo_name, pr_data in zip(repo_names, fetched):
+                pr_data_by_repo[repo_name] = pr_data
+                all_pr_data.extend(pr_data)
 
             click.echo(f"\nFound {len(all_pr_data)} pull requests across {len(pr_data_by_repo)} repositories")
             click.echo()
             
             # Save raw PR data to JSON
-            output_dir_path = Path(output_dir)
-            output_dir_path.mkdir(parents=True, exist_ok=True)
-            raw_data_path = output_dir_path / f"{organization}-{user}-{year}-raw-pr-data.json"
+            raw_data_path = output_dir / f"{organization}-{user}-{year}-raw-pr-data.json"
             
             click.echo(f"Saving raw PR data to {raw_data_path}...")
-            with open(raw_data_path, 'w') as f:
+            # Stream the encoded chunks to the file rather than holding the
+            # whole serialized dump in memory
+            with open(raw_data_path, "w") as f:
                 json.dump(all_pr_data, f, indent=2, default=str)
             click.echo(f"✓ Raw PR data saved: {raw_data_path}")
             click.echo()
@@ -163,8 +219,9 @@ def main(organization, user, year, token, output_dir, pr_data_file):
         for repo_name, pr_data in pr_data_by_repo.items():
             analyzer_by_repo[repo_name] = PRAnalyzer(pr_data)
         
-        # Create aggregated analyzer
-        aggregated_analyzer = PRAnalyzer(all_pr_data)
+        # Create aggregated analyzer by merging the per-repo statistics rather
+        # than scanning every PR again
+        aggregated_analyzer = PRAnalyzer.combine(analyzer_by_repo.values())
         
         # Get monthly data by repo
         monthly_data_by_repo = {}
@@ -178,45 +235,56 @@ def main(organization, user, year, token, output_dir, pr_data_file):
         click.echo()
 
         # Generate reports
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
         generator = ReportGenerator(organization, user, year)
 
-        # 1. Generate JSON output
-        json_path = output_dir / f"{organization}-{user}-{year}-data.json"
-        generator.generate_json_output(
-            pr_data_by_repo, analyzer_by_repo, aggregated_analyzer, str(json_path)
-        )
-        click.echo(f"✓ JSON data: {json_path}")
-
-        # 2. Generate yearly summary by repo
-        yearly_by_repo_path = output_dir / f"{organization}-{user}-{year}-by-repo-summary.md"
-        generator.generate_yearly_summary_by_repo(
-            pr_data_by_repo, analyzer_by_repo, str(yearly_by_repo_path)
-        )
-        click.echo(f"✓ Yearly summary (by repo): {yearly_by_repo_path}")
-
-        # 3. Generate yearly summary aggregated
-        yearly_agg_path = output_dir / f"{organization}-{user}-{year}-aggregated-summary.md"
-        generator.generate_yearly_summary_aggregated(
-            aggregated_analyzer, analyzer_by_repo, str(yearly_agg_path)
-        )
-        click.echo(f"✓ Yearly summary (aggregated): {yearly_agg_path}")
-
-        # 4. Generate monthly breakdown by repo
-        monthly_by_repo_path = output_dir / f"{organization}-{user}-{year}-by-repo-monthly.md"
-        generator.generate_monthly_breakdown_by_repo(
-            monthly_data_by_repo, str(monthly_by_repo_path)
-        )
-        click.echo(f"✓ Monthly breakdown (by repo): {monthly_by_repo_path}")
+        # Each report is written to its own file from already computed data, so
+        # generate them concurrently and report completion in a fixed order
+        reports = [
+            # 1. JSON output
+            (
+                "JSON data",
+                output_dir / f"{organization}-{user}-{year}-data.json",
+                generator.generate_json_output,
+                (pr_data_by_repo, analyzer_by_repo, aggregated_analyzer),
+            ),
+            # 2. Yearly summary by repo
+            (
+                "Yearly summary (by repo)",
+                output_dir / f"{organization}-{user}-{year}-by-repo-summary.md",
+                generator.generate_yearly_summary_by_repo,
+                (pr_data_by_repo, analyzer_by_repo),
+            ),
+            # 3. Yearly summary aggregated
+            (
+                "Yearly summary (aggregated)",
+                output_dir / f"{organization}-{user}-{year}-aggregated-summary.md",
+                generator.generate_yearly_summary_aggregated,
+                (aggregated_analyzer, analyzer_by_repo),
+            ),
+            # 4. Monthly breakdown by repo
+            (
+                "Monthly breakdown (by repo)",
+                output_dir / f"{organization}-{user}-{year}-by-repo-monthly.md",
+                generator.generate_monthly_breakdown_by_repo,
+                (monthly_data_by_repo,),
+            ),
+            # 5. Monthly breakdown aggregated
+            (
+                "Monthly breakdown (aggregated)",
+                output_dir / f"{organization}-{user}-{year}-aggregated-monthly.md",
+                generator.generate_monthly_breakdown_aggregated,
+                (aggregated_monthly,),
+            ),
+        ]
 
-        # 5. Generate monthly breakdown aggregated
-        monthly_agg_path = output_dir / f"{organization}-{user}-{year}-aggregated-monthly.md"
-        generator.generate_monthly_breakdown_aggregated(
-            aggregated_monthly, str(monthly_agg_path)
-        )
-        click.echo(f"✓ Monthly breakdown (aggregated): {monthly_agg_path}")
+        with ThreadPoolExecutor(max_workers=len(reports)) as executor:
+            futures = [
+                executor.submit(generate, *args, str(path))
+                for _, path, generate, args in reports
+            ]
+            for (label, path, _, _), future in zip(reports, futures):
+                future.result()
+                click.echo(f"✓ {label}: {path}")
 
         click.echo()
         click.echo(click.style("Reports generated successfully!", fg="green", bold=True))
@@ -1,31 +1,202 @@
 """GitHub API client for fetching PR data."""
 
+import logging
 import re
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional, Set
-from github import Github, PullRequest, Repository
-from github.GithubException import GithubException
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Set, Union
+from github import Github, Issue, PullRequest, Repository
+from github.GithubException import GithubException, RateLimitExceededException
+
+logger = logging.getLogger(__name__)
+
+# Reads a label's name; mapped over a PR's labels in one C-level pass
+_label_name = attrgetter("name")
+
+# Selection of a page of a PR's commit messages in a GraphQL query; GitHub
+# caps connection pages at 100 nodes, so longer histories are paged through
+COMMITS_PAGE_FIELDS = "nodes { commit { message } } pageInfo { hasNextPage endCursor }"
+
+# Query for the commits of a single PR after a cursor, used to page through
+# PRs with more commits than fit in the batched details query
+MORE_COMMITS_QUERY = (
+    "query($owner: String!, $name: String!, $number: Int!, $cursor: String!) "
+    "{ repository(owner: $owner, name: $name) { pullRequest(number: $number) "
+    "{ commits(first: 100, after: $cursor) { %s } } } }" % COMMITS_PAGE_FIELDS
+)
+
+
+def _commit_messages(commits: Dict[str, Any]) -> List[str]:
+    """
+    Read the non-empty commit messages from a page of a GraphQL commits connection.
+
+    Args:
+        commits: The commits connection of a pullRequest node
+
+    Returns:
+        List of commit messages
+    """
+    return [node["commit"]["message"] for node in commits["nodes"] if node["commit"]["message"]]
 
 
 class GitHubPRClient:
     """Client for fetching and processing GitHub pull request data."""
 
-    def __init__(self, token: str):
+    # Items per page for paginated REST results (the API maximum), so PR listings
+    # take a third of the round trips of the default 30
+    PER_PAGE = 100
+
+    # PRs whose details are fetched in a single GraphQL query
+    DETAILS_QUERY_BATCH_SIZE = 25
+
+    # Most results the Search API returns for one query, however many match
+    SEARCH_RESULT_LIMIT = 1000
+
+    def __init__(self, token: str, pool_size: Optional[int] = None):
         """
         Initialize the GitHub client.
 
         Args:
             token: GitHub personal access token (required for org access).
+            pool_size: Number of pooled keep-alive connections to the API; set
+                it to the number of threads sharing the client so concurrent
+                requests reuse connections instead of opening new ones
+                (default: PyGithub's default pool)
         """
-        self.github = Github(token)
+        self.github = Github(token, per_page=self.PER_PAGE, pool_size=pool_size)
         self.user = self.github.get_user()
 
     def get_user_repos_in_org(
-        self, org_name: str, username: str
+        self, org_name: str, username: str, year: Optional[int] = None
     ) -> List[Repository.Repository]:
         """
         Get all repositories in an organization where a user has contributed.
 
+        A single issue search for the user's PRs finds the repositories
+        server-side. If search is unavailable (for example the name is not
+        searchable as an organization), every repository is scanned instead.
+        Each repository found costs a request to load it, so use
+        get_user_prs_in_org when the PRs themselves are needed.
+
+        Args:
+            org_name: Organization name
+            username: GitHub username
+            year: Only consider PRs created in this year (default: any time)
+
+        Returns:
+            List of Repository objects
+
+        Raises:
+            RateLimitExceededException: If the search was rate limited
+        """
+        query = f"is:pr author:{username} org:{org_name}"
+        if year:
+            query += f" created:{year}-01-01..{year}-12-31"
+
+        try:
+            repo_names = list(self._search_prs_by_repo(query))
+        except RateLimitExceededException:
+            raise
+        except GithubException:
+            return self._scan_user_repos_in_org(org_name, username)
+        return [self.github.get_repo(repo_name) for repo_name in repo_names]
+
+    def _search_prs_by_repo(self, query: str) -> Dict[str, List[Issue.Issue]]:
+        """
+        Run an issue search for PRs and group the results by repository.
+
+        Search results carry the repository API URL, so they are grouped by
+        repo name without completing each issue. The Search API returns at
+        most SEARCH_RESULT_LIMIT results per query; a warning is logged when
+        that many come back, since matches beyond them are silently dropped.
+
+        Args:
+            query: Issue search query
+
+        Returns:
+            Dictionary mapping repository full name (owner/name) to its search
+            results, in the order the repositories were found
+
+        Raises:
+            GithubException: If the search fails
+        """
+        prs_by_repo: Dict[str, List[Issue.Issue]] = {}
+        found = 0
+        for issue in self.github.search_issues(query):
+            repo_name = issue.repository_url.split("/repos/", 1)[-1]
+            prs_by_repo.setdefault(repo_name, []).append(issue)
+            found += 1
+
+        if found >= self.SEARCH_RESULT_LIMIT:
+            logger.warning(
+                "Search returned the maximum of %d results, so some PRs may be missing; "
+                "narrow the query (for example to a single year) to include them all: %s",
+                self.SEARCH_RESULT_LIMIT, query,
+            )
+        return prs_by_repo
+
+    def get_user_prs_in_org(
+        self, org_name: str, username: str, year: Optional[int] = None
+    ) -> Dict[str, List[Union[Issue.Issue, PullRequest.PullRequest]]]:
+        """
+        Find a user's pull requests across an organization, grouped by repository.
+
+        A single issue search finds every PR the user opened in range,
+        server-side. The results are returned as they are: they carry every PR
+        field except the ones get_pr_details fetches in batches, so completing
+        each into a PullRequest would cost a request per PR. If search is
+        unavailable (for example the name is not searchable as an
+        organization), every repository is scanned and its PRs listed instead.
+        Rate limiting is not treated as search being unavailable, since the
+        scan would only repeat the throttled work far more slowly.
+
+        Args:
+            org_name: Organization name
+            username: GitHub username
+            year: Year to fetch PRs for. If None, uses the last 365 days from now.
+
+        Returns:
+            Dictionary mapping repository full name (owner/name) to the user's
+            PRs in it, in the order the repositories were found: search result
+            Issue objects, or PullRequest objects when search was unavailable
+
+        Raises:
+            RateLimitExceededException: If the search was rate limited
+        """
+        # Calculate date range (use timezone-aware UTC datetimes to match PR timestamps)
+        if year:
+            start_date = datetime(year, 1, 1, tzinfo=timezone.utc)
+            end_date = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+        else:
+            end_date = datetime.now(timezone.utc)
+            start_date = end_date - timedelta(days=365)
+
+        query = (
+            f"is:pr author:{username} org:{org_name} "
+            f"created:{start_date.date()}..{end_date.date()}"
+        )
+        try:
+            return self._search_prs_by_repo(query)
+        except RateLimitExceededException:
+            raise
+        except GithubException as e:
+            logger.warning(
+                "PR search in %s failed, scanning its repositories instead: %s", org_name, e
+            )
+
+        prs_by_repo: Dict[str, List[Union[Issue.Issue, PullRequest.PullRequest]]] = {}
+        for repo in self._scan_user_repos_in_org(org_name, username):
+            prs = self._list_prs_for_user_in_repo(repo, username, start_date, end_date)
+            if prs:
+                prs_by_repo[repo.full_name] = prs
+        return prs_by_repo
+
+    def _scan_user_repos_in_org(
+        self, org_name: str, username: str
+    ) -> List[Repository.Repository]:
+        """
+        Find a user's repositories by scanning the PRs of every repository.
+
         Args:
             org_name: Organization name
             username: GitHub username
@@ -56,8 +227,11 @@ class GitHubPRClient:
                 continue
 
             try:
-                repo_prs = repo.get_pulls(state="all")
-                for pr in repo_prs:
+                # Page through the repository's PRs rather than searching per
+                # repository: this path runs when search is already failing,
+                # and the Search API's 30 requests a minute would throttle
+                # any organization with more repositories than that
+                for pr in repo.get_pulls(state="all"):
                     if pr.user and pr.user.login == username:
                         repos.append(repo)
                         seen.add(full_name)
@@ -74,6 +248,10 @@ class GitHubPRClient:
         """
         Fetch all pull requests by a specific user in a repository for a given year.
 
+        The repository's PRs are listed and filtered locally. To find a user's
+        PRs across many repositories, use get_user_prs_in_org, which takes a
+        single search rather than a listing per repository.
+
         Args:
             repo: Repository object
             username: GitHub username
@@ -90,6 +268,27 @@ class GitHubPRClient:
             end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=365)
 
+        return self._list_prs_for_user_in_repo(repo, username, start_date, end_date)
+
+    def _list_prs_for_user_in_repo(
+        self,
+        repo: Repository.Repository,
+        username: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[PullRequest.PullRequest]:
+        """
+        Find a user's PRs in a date range by listing the repository's PRs.
+
+        Args:
+            repo: Repository object
+            username: GitHub username
+            start_date: Earliest creation time to include
+            end_date: Latest creation time to include
+
+        Returns:
+            List of PullRequest objects
+        """
         prs = []
         try:
             # Get all PRs by this user (both open and closed)
@@ -154,48 +353,194 @@ class GitHubPRClient:
 
         return prs
 
-    def extract_pr_data(self, pr: PullRequest.PullRequest, repo_name: str = None) -> Dict[str, Any]:
+    def get_pr_details(
+        self, repo_name: str, pr_numbers: List[int], fetch_commits: bool = True
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch the PR fields missing from search and list results with batched GraphQL queries.
+
+        Issue search results and PRs listed by get_pulls() lack the merged flag,
+        line counts and commits (search results lack the merge time as well),
+        so reading them costs a detail request plus a commits request per PR.
+        Each query here covers DETAILS_QUERY_BATCH_SIZE PRs instead, with the
+        first 100 commits of each; PRs with more commits are paged through
+        with follow-up queries.
+
+        Args:
+            repo_name: Repository full name (owner/name)
+            pr_numbers: Numbers of the PRs to fetch details for
+            fetch_commits: Whether to fetch commit messages; when False they
+                are left out of the query and returned as empty lists
+
+        Returns:
+            Dictionary mapping PR number to its merged flag, merged_at,
+            additions, deletions, changed_files and commit_messages. PRs whose batch could
+            not be fetched are missing, so callers can fall back to
+            extract_pr_data's per-PR lookups.
+        """
+        owner, name = repo_name.split("/", 1)
+        details: Dict[int, Dict[str, Any]] = {}
+        commits_field = (
+            f"commits(first: 100) {{ {COMMITS_PAGE_FIELDS} }} " if fetch_commits else ""
+        )
+
+        for start in range(0, len(pr_numbers), self.DETAILS_QUERY_BATCH_SIZE):
+            batch = pr_numbers[start:start + self.DETAILS_QUERY_BATCH_SIZE]
+            fields = " ".join(
+                f"pr{number}: pullRequest(number: {number}) "
+                f"{{ merged mergedAt additions deletions changedFiles {commits_field}}}"
+                for number in batch
+            )
+            query = (
+                "query($owner: String!, $name: String!) "
+                f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            )
+            try:
+                _, response = self.github.requester.graphql_query(
+                    query, {"owner": owner, "name": name}
+                )
+            except GithubException as e:
+                logger.warning(
+                    "Failed to fetch details for PRs %s in %s, reading them per PR: %s",
+                    batch, repo_name, e,
+                )
+                continue
+
+            repository = response["data"]["repository"]
+            for number in batch:
+                pull_request = repository.get(f"pr{number}")
+                if pull_request:
+                    commit_messages = []
+                    if fetch_commits:
+                        commits = pull_request["commits"]
+                        commit_messages = _commit_messages(commits)
+                        if commits["pageInfo"]["hasNextPage"]:
+                            commit_messages += self._get_more_commit_messages(
+                                owner, name, number, commits["pageInfo"]["endCursor"]
+                            )
+                    merged_at = pull_request["mergedAt"]
+                    details[number] = {
+                        "merged": pull_request["merged"],
+                        "merged_at": datetime.fromisoformat(merged_at) if merged_at else None,
+                        "additions": pull_request["additions"],
+                        "deletions": pull_request["deletions"],
+                        "changed_files": pull_request["changedFiles"],
+                        "commit_messages": commit_messages,
+                    }
+
+        return details
+
+    def _get_more_commit_messages(
+        self, owner: str, name: str, number: int, cursor: str
+    ) -> List[str]:
+        """
+        Page through the commits of a PR beyond those in the details query.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            number: PR number
+            cursor: End cursor of the last page already fetched
+
+        Returns:
+            Commit messages after the cursor; if a page fails to load, the
+            messages read up to that point
+        """
+        messages: List[str] = []
+        while cursor:
+            try:
+                _, response = self.github.requester.graphql_query(
+                    MORE_COMMITS_QUERY,
+                    {"owner": owner, "name": name, "number": number, "cursor": cursor},
+                )
+            except GithubException as e:
+                logger.warning(
+                    "Failed to fetch remaining commits of %s/%s#%d: %s", owner, name, number, e
+                )
+                break
+
+            commits = response["data"]["repository"]["pullRequest"]["commits"]
+            messages += _commit_messages(commits)
+            page_info = commits["pageInfo"]
+            cursor = page_info["endCursor"] if page_info["hasNextPage"] else None
+
+        return messages
+
+    def extract_pr_data(
+        self,
+        pr: Union[Issue.Issue, PullRequest.PullRequest],
+        repo_name: str = None,
+        details: Optional[Dict[str, Any]] = None,
+        fetch_commits: bool = True,
+    ) -> Dict[str, Any]:
         """
         Extract relevant data from a pull request.
 
         Args:
-            pr: PullRequest object
+            pr: PullRequest object, or the PR's Issue from an issue search
             repo_name: Repository name (optional, for org-wide analysis)
+            details: Fields already fetched for the PR by get_pr_details; read
+                from the PR (one request each when missing) when omitted, after
+                completing a search result Issue into its PullRequest
+            fetch_commits: Whether to fetch commit messages when no details are
+                given; skipping them saves a request per PR when the
+                conventional commit breakdown isn't needed
 
         Returns:
             Dictionary containing PR data
         """
+        # Each PullRequest attribute read goes through PyGithub's lazy
+        # completion check, so read the ones used twice only once
+        created_at = pr.created_at
+        closed_at = pr.closed_at
+        user = pr.user
+
         # Calculate time to close
         time_to_close = None
-        if pr.closed_at and pr.created_at:
-            time_to_close = (pr.closed_at - pr.created_at).total_seconds() / 3600  # hours
+        if closed_at and created_at:
+            time_to_close = (closed_at - created_at).total_seconds() / 3600  # hours
 
-        # Get commit messages for conventional commit analysis
-        commit_messages = []
-        try:
-            for commit in pr.get_commits():
-                if commit.commit and commit.commit.message:
-                    commit_messages.append(commit.commit.message)
-        except:
-            pass
+        if details is None:
+            if isinstance(pr, Issue.Issue):
+                # Only the full PullRequest has the fields get_pr_details fetches
+                pr = pr.as_pull_request()
+
+            # Get commit messages for conventional commit analysis
+            commit_messages = []
+            if fetch_commits:
+                try:
+                    for commit in pr.get_commits():
+                        if commit.commit and commit.commit.message:
+                            commit_messages.append(commit.commit.message)
+                except:
+                    pass
+
+            details = {
+                "merged": pr.merged,
+                "merged_at": pr.merged_at,
+                "additions": pr.additions,
+                "deletions": pr.deletions,
+                "changed_files": pr.changed_files,
+                "commit_messages": commit_messages,
+            }
 
         data = {
             "number": pr.number,
             "title": pr.title,
             "state": pr.state,
-            "created_at": pr.created_at,
-            "closed_at": pr.closed_at,
-            "merged_at": pr.merged_at,
-            "merged": pr.merged,
-            "author": pr.user.login if pr.user else None,
+            "created_at": created_at,
+            "closed_at": closed_at,
+            "merged_at": details["merged_at"],
+            "merged": details["merged"],
+            "author": user.login if user else None,
             "description": pr.body or "",
-            "labels": [label.name for label in pr.labels],
+            "labels": list(map(_label_name, pr.labels)),
             "time_to_close_hours": time_to_close,
             "url": pr.html_url,
-            "additions": pr.additions,
-            "deletions": pr.deletions,
-            "changed_files": pr.changed_files,
-            "commit_messages": commit_messages,
+            "additions": details["additions"],
+            "deletions": details["deletions"],
+            "changed_files": details["changed_files"],
+            "commit_messages": details["commit_messages"],
         }
         
         if repo_name:
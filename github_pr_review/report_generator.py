@@ -2,9 +2,73 @@
 
 import json
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, TextIO, Tuple
 from pathlib import Path
 from collections import defaultdict
+from itertools import islice
+
+
+# Buffer size for report files, so JSON output's many small writes reach the
+# OS in large chunks
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Emoji shown next to each conventional commit type
+COMMIT_TYPE_EMOJI = {
+    'feat': '✨', 'fix': '🐛', 'docs': '📚', 'chore': '🔧', 'refactor': '♻️',
+    'test': '✅', 'ci': '👷', 'perf': '⚡', 'style': '💄', 'build': '🏗️',
+}
+
+# English month names by month number - 1, for labelling "YYYY-MM" keys
+# without parsing them as dates
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# One month of the aggregated monthly breakdown, filled from the month's
+# statistics with its work item and code change counts merged in
+MONTHLY_SECTION_TEMPLATE = """## 📆 {month_name}
+
+### 📊 Overview
+- 🔢 **Total PRs:** {total_prs}
+- ✅ **Merged:** {merged}
+- ❌ **Closed (not merged):** {closed_not_merged}
+- 🔓 **Still Open:** {still_open}
+- ⏰ **Avg Time to Close:** {avg_time}
+
+{conventional}### 🔗 Work Items
+- 🔖 **GitHub Issues:** {total_github_issues}
+- 📋 **Jira Tickets:** {total_jira_tickets}
+- ✅ **PRs with Work Items:** {prs_with_work_items} ({percentage_with_work_items:.1f}%)
+
+### 💻 Code Changes
+- ➕ **Lines Added:** {total_additions:,}
+- ➖ **Lines Deleted:** {total_deletions:,}
+- 📄 **Files Changed:** {total_files_changed:,}
+
+
+---
+
+"""
+
+# Conventional commit block of MONTHLY_SECTION_TEMPLATE, for months that have one
+MONTHLY_CONVENTIONAL_TEMPLATE = """### 🏷️ Conventional Commits
+- 📝 **PRs with Conventional Commits:** {prs_with_conventional_commits}
+- ✨ **Feat Count:** {feat_count}
+- 🐛 **Fix Count:** {fix_count}
+
+"""
+
+# Heading and metadata block every markdown report starts with
+REPORT_HEADER_TEMPLATE = """# {title} - {year} ({scope})
+
+**Organization:** {org}  
+**User:** {user}  
+**Generated:** {generated}
+
+---
+
+"""
 
 
 class ReportGenerator:
@@ -22,6 +86,12 @@ class ReportGenerator:
         self.org = org
         self.user = user
         self.year = year
+        # One timestamp for every report from this generator
+        self.generated_at = datetime.now()
+        self._generated = self.generated_at.strftime("%Y-%m-%d %H:%M:%S")
+        # Report directories already created, so reports sharing one are
+        # written without re-creating it
+        self._created_dirs: Set[Path] = set()
 
     def _format_time(self, hours: float) -> str:
         """
@@ -36,13 +106,16 @@ class ReportGenerator:
         if hours is None:
             return "N/A"
 
-        days = int(hours // 24)
-        remaining_hours = int(hours % 24)
-        minutes = int((hours % 1) * 60)
+        # One divmod gives both whole days and the leftover hours; the minutes
+        # are only worked out when no whole day is shown
+        days, remainder = divmod(hours, 24)
+        remaining_hours = int(remainder)
 
         if days > 0:
-            return f"{days}d {remaining_hours}h"
-        elif remaining_hours > 0:
+            return f"{int(days)}d {remaining_hours}h"
+
+        minutes = int((remainder % 1) * 60)
+        if remaining_hours > 0:
             return f"{remaining_hours}h {minutes}m"
         else:
             return f"{minutes}m"
@@ -50,6 +123,56 @@ class ReportGenerator:
     def _format_currency(self, amount: float) -> str:
         """Format currency amount."""
         return f"${amount:,.0f}"
+
+    @staticmethod
+    def _render_kv(items: List[Tuple[str, str, Any]], line_end: str = "\n") -> str:
+        """
+        Render a block of labelled values as markdown list items.
+
+        Args:
+            items: (emoji, label, value) for each line, in order
+            line_end: Text that ends each line
+
+        Returns:
+            One "- emoji **label:** value" line per item
+        """
+        return "".join(f"- {emoji} **{label}:** {value}{line_end}" for emoji, label, value in items)
+
+    def _open_output(self, output_path: str) -> TextIO:
+        """
+        Open a report file for writing, creating its directory on first use.
+
+        Args:
+            output_path: Path of the report file
+
+        Returns:
+            File opened for writing with a WRITE_BUFFER_SIZE buffer
+        """
+        parent = Path(output_path).parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+        return open(output_path, "w", buffering=WRITE_BUFFER_SIZE)
+
+    def _report_header(self, title: str, scope: str) -> str:
+        """
+        Render the heading and metadata block of a markdown report.
+
+        Args:
+            title: Report title, including its leading emoji
+            scope: Report scope shown after the year (e.g. "Aggregated")
+
+        Returns:
+            Markdown header ending with a horizontal rule
+        """
+        return REPORT_HEADER_TEMPLATE.format(
+            title=title,
+            year=self.year,
+            scope=scope,
+            org=self.org,
+            user=self.user,
+            generated=self._generated,
+        )
     
     def _generate_commit_type_pie_chart(self, commit_types: Dict[str, int], total: int) -> str:
         """
@@ -99,11 +222,9 @@ xychart
         chart += '    x-axis ['
         
         # Add month labels
-        month_labels = []
-        for month in prs_per_month.keys():
-            month_name = datetime.strptime(month, "%Y-%m").strftime("%b")
-            month_labels.append(f'"{month_name}"')
-        chart += ", ".join(month_labels)
+        chart += ", ".join(
+            f'"{MONTH_NAMES[int(month[5:7]) - 1][:3]}"' for month in prs_per_month
+        )
         chart += ']\n'
         
         # Add PR counts
@@ -131,12 +252,8 @@ xychart
         
         # Build treemap in mermaid `treemap-beta` syntax.
         # Category = repository, items = top commit types with counts.
-        if not analyzer_by_repo:
-            return ""
-
-        lines: List[str] = []
-        lines.append("```mermaid")
-        lines.append("treemap-beta")
+        lines: List[str] = ["```mermaid", "treemap-beta"]
+        append = lines.append
 
         # For each repo, list top commit types (limit to top 5 per repo)
         for repo, analyzer in analyzer_by_repo.items():
@@ -145,20 +262,20 @@ xychart
 
             if not commit_types:
                 # Still output the repo as a category with an empty placeholder
-                lines.append(f'"{repo}"')
+                append(f'"{repo}"')
                 continue
 
-            # Get top 5 commit types per repo (name and count)
-            top_types = sorted(commit_types.items(), key=lambda x: x[1], reverse=True)[:5]
+            # Get top 5 commit types per repo (already ordered most common first)
+            top_types = islice(commit_types.items(), 5)
 
             # Category header
-            lines.append(f'"{repo}"')
+            append(f'"{repo}"')
             for name, count in top_types:
                 # Indented item lines with value following the example
-                lines.append(f'    "{name}": {count}')
+                append(f'    "{name}": {count}')
 
-        lines.append("```")
-        lines.append("")
+        append("```")
+        append("")
 
         return "\n".join(lines)
 
@@ -184,7 +301,7 @@ xychart
                 "organization": self.org,
                 "user": self.user,
                 "year": self.year,
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": self.generated_at.isoformat(),
             },
             "summary": {
                 "total_prs": aggregated_analyzer.get_total_prs(),
@@ -219,8 +336,7 @@ xychart
             }
 
         # Save JSON
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
+        with self._open_output(output_path) as f:
             json.dump(data, f, indent=2, default=str)
 
     def generate_yearly_summary_by_repo(
@@ -237,59 +353,62 @@ xychart
             analyzer_by_repo: Analyzer instances for each repo
             output_path: Path to save the report
         """
-        report = f"""# 📊 GitHub PR Year in Review - {self.year} (By Repository)
-
-**Organization:** {self.org}  
-**User:** {self.user}  
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
----
-
-"""
+        parts: List[str] = []
+        add = parts.append
+        fmt = self._format_time
+        kv = self._render_kv
+        add(self._report_header("📊 GitHub PR Year in Review", "By Repository"))
 
         for repo, analyzer in analyzer_by_repo.items():
-            report += f"## 📦 {repo}\n\n"
+            add(f"## 📦 {repo}\n\n")
             
             avg_time = analyzer.get_average_time_to_close()
             work_items = analyzer.get_work_item_analysis()
             code_stats = analyzer.get_code_change_stats()
             conv_commits = analyzer.get_conventional_commits_analysis()
 
-            report += f"### 📊 Summary Statistics\n\n"
-            report += f"- 🔢 **Total PRs:** {analyzer.get_total_prs()}\n"
-            report += f"- ✅ **Merged:** {analyzer.get_merged_prs_count()}\n"
-            report += f"- ❌ **Closed (not merged):** {analyzer.get_closed_prs_count()}\n"
-            report += f"- 🔓 **Still Open:** {analyzer.get_open_prs_count()}\n"
-            report += f"- ⏰ **Average Time to Close:** {self._format_time(avg_time)}\n\n"
-
-            report += f"### 🏷️ Conventional Commits\n\n"
-            report += f"- 📝 **PRs with Conventional Commits:** {conv_commits['prs_with_conventional_commits']} ({conv_commits['percentage_with_conventional']:.1f}%)\n"
+            add(f"### 📊 Summary Statistics\n\n")
+            add(kv([
+                ("🔢", "Total PRs", analyzer.get_total_prs()),
+                ("✅", "Merged", analyzer.get_merged_prs_count()),
+                ("❌", "Closed (not merged)", analyzer.get_closed_prs_count()),
+                ("🔓", "Still Open", analyzer.get_open_prs_count()),
+                ("⏰", "Average Time to Close", fmt(avg_time)),
+            ]))
+            add("\n")
+
+            add(f"### 🏷️ Conventional Commits\n\n")
+            add(f"- 📝 **PRs with Conventional Commits:** {conv_commits['prs_with_conventional_commits']} ({conv_commits['percentage_with_conventional']:.1f}%)\n")
             if conv_commits['commit_types']:
-                report += f"- **Commit Type Breakdown:**\n"
-                for commit_type, count in list(conv_commits['commit_types'].items())[:5]:
-                    emoji = {'feat': '✨', 'fix': '🐛', 'docs': '📚', 'chore': '🔧', 'refactor': '♻️', 
-                            'test': '✅', 'ci': '👷', 'perf': '⚡', 'style': '💄', 'build': '🏗️'}.get(commit_type, '📌')
-                    report += f"  - `{emoji} {commit_type}`: {count}\n"
+                add(f"- **Commit Type Breakdown:**\n")
+                for commit_type, count in islice(conv_commits['commit_types'].items(), 5):
+                    emoji = COMMIT_TYPE_EMOJI.get(commit_type, '📌')
+                    add(f"  - `{emoji} {commit_type}`: {count}\n")
             if conv_commits['feat_fix_ratio'] is not None:
-                report += f"- ⚖️ **Feat/Fix Ratio:** {conv_commits['feat_fix_ratio']:.2f}\n"
-            report += "\n"
-
-            report += f"### 🔗 Work Items\n\n"
-            report += f"- 🔖 **GitHub Issues Referenced:** {work_items['total_github_issues']} \n"
-            report += f"- 📋 **Jira Tickets Referenced:** {work_items['total_jira_tickets']} \n"
-            report += f"- ✅ **PRs with Work Items:** {work_items['prs_with_work_items']} ({work_items['percentage_with_work_items']:.1f}%) \n\n"
-
-            report += f"### 💻 Code Changes\n\n"
-            report += f"- ➕ **Total Lines Added:** {code_stats['total_additions']:,} \n"
-            report += f"- ➖ **Total Lines Deleted:** {code_stats['total_deletions']:,} \n"
-            report += f"- 📄 **Total Files Changed:** {code_stats['total_files_changed']:,} \n\n"
-
-            report += "---\n\n"
+                add(f"- ⚖️ **Feat/Fix Ratio:** {conv_commits['feat_fix_ratio']:.2f}\n")
+            add("\n")
+
+            add(f"### 🔗 Work Items\n\n")
+            add(kv([
+                ("🔖", "GitHub Issues Referenced", work_items['total_github_issues']),
+                ("📋", "Jira Tickets Referenced", work_items['total_jira_tickets']),
+                ("✅", "PRs with Work Items", f"{work_items['prs_with_work_items']} ({work_items['percentage_with_work_items']:.1f}%)"),
+            ], " \n"))
+            add("\n")
+
+            add(f"### 💻 Code Changes\n\n")
+            add(kv([
+                ("➕", "Total Lines Added", f"{code_stats['total_additions']:,}"),
+                ("➖", "Total Lines Deleted", f"{code_stats['total_deletions']:,}"),
+                ("📄", "Total Files Changed", f"{code_stats['total_files_changed']:,}"),
+            ], " \n"))
+            add("\n")
+
+            add("---\n\n")
 
         # Save report
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(report)
+        with self._open_output(output_path) as f:
+            f.writelines(parts)
 
     def generate_yearly_summary_aggregated(
         self, aggregated_analyzer: Any, analyzer_by_repo: Dict[str, Any], output_path: str
@@ -308,24 +427,28 @@ xychart
         code_stats = aggregated_analyzer.get_code_change_stats()
         conv_commits = aggregated_analyzer.get_conventional_commits_analysis()
         business = aggregated_analyzer.get_business_insights()
+        savings = business['estimated_cost_savings']
+        velocity = business['velocity_metrics']
+        productivity = business['productivity_metrics']
         repos_by_count = aggregated_analyzer.get_prs_by_repo()
+        total_prs = aggregated_analyzer.get_total_prs()
+        merged_prs = aggregated_analyzer.get_merged_prs_count()
+        merge_rate = merged_prs / max(total_prs, 1) * 100
+        conventional_pct = conv_commits['percentage_with_conventional']
+        total_typed = conv_commits['total_typed_commits']
+        work_item_pct = work_items['percentage_with_work_items']
         
         # Format feat/fix ratio
         feat_fix_ratio_str = f"{conv_commits['feat_fix_ratio']:.2f}" if conv_commits['feat_fix_ratio'] is not None else "N/A"
 
-        report = f"""# 📊 GitHub PR Year in Review - {self.year} (Aggregated)
-
-**Organization:** {self.org}  
-**User:** {self.user}  
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
----
-
-## 📈 Executive Summary
+        parts: List[str] = []
+        add = parts.append
+        add(self._report_header("📊 GitHub PR Year in Review", "Aggregated"))
+        add(f"""## 📈 Executive Summary
 
 ### Pull Request Overview
-- 🔢 **Total PRs:** {aggregated_analyzer.get_total_prs()}
-- ✅ **Merged:** {aggregated_analyzer.get_merged_prs_count()} ({aggregated_analyzer.get_merged_prs_count() / max(aggregated_analyzer.get_total_prs(), 1) * 100:.1f}%)
+- 🔢 **Total PRs:** {total_prs}
+- ✅ **Merged:** {merged_prs} ({merge_rate:.1f}%)
 - ❌ **Closed (not merged):** {aggregated_analyzer.get_closed_prs_count()}
 - 🔓 **Still Open:** {aggregated_analyzer.get_open_prs_count()}
 - 📦 **Repositories Contributed To:** {len(repos_by_count)}
@@ -333,50 +456,49 @@ xychart
 ### ⏱️ Time Metrics
 - ⏰ **Average Time to Close:** {self._format_time(avg_time)}
 - ⏰ **Median Time to Close:** {self._format_time(median_time)}
-- {'🚀' if business['velocity_metrics']['velocity_score'] == 'high' else '⚡' if business['velocity_metrics']['velocity_score'] == 'medium' else '🐢'} **Velocity Score:** {business['velocity_metrics']['velocity_score'].upper()}
+- {'🚀' if velocity['velocity_score'] == 'high' else '⚡' if velocity['velocity_score'] == 'medium' else '🐢'} **Velocity Score:** {velocity['velocity_score'].upper()}
 
 ---
 
 ## 🏷️ Conventional Commits Analysis
 
-- 📝 **PRs with Conventional Commits:** {conv_commits['prs_with_conventional_commits']} ({conv_commits['percentage_with_conventional']:.1f}%)
-- 🔢 **Total Typed Commits:** {conv_commits['total_typed_commits']} 
+- 📝 **PRs with Conventional Commits:** {conv_commits['prs_with_conventional_commits']} ({conventional_pct:.1f}%)
+- 🔢 **Total Typed Commits:** {total_typed} 
 - ✨ **Feature Commits:** {conv_commits['feat_count']}
 - 🐛 **Bug Fix Commits:** {conv_commits['fix_count']} 
 - ⚖️ **Feat/Fix Ratio:** {feat_fix_ratio_str} 
 
 ### Commit Type Breakdown
 
-"""
+""")
 
         if conv_commits['commit_types']:
             for commit_type, count in conv_commits['commit_types'].items():
-                percentage = (count / conv_commits['total_typed_commits'] * 100) if conv_commits['total_typed_commits'] else 0
-                emoji = {'feat': '✨', 'fix': '🐛', 'docs': '📚', 'chore': '🔧', 'refactor': '♻️', 
-                        'test': '✅', 'ci': '👷', 'perf': '⚡', 'style': '💄', 'build': '🏗️'}.get(commit_type, '📌')
-                report += f"- {emoji} **{commit_type}:** {count} ({percentage:.1f}%) \n"
+                percentage = (count / total_typed * 100) if total_typed else 0
+                emoji = COMMIT_TYPE_EMOJI.get(commit_type, '📌')
+                add(f"- {emoji} **{commit_type}:** {count} ({percentage:.1f}%) \n")
         
         # Add pie chart
-        report += "\n" + self._generate_commit_type_pie_chart(conv_commits['commit_types'], conv_commits['total_typed_commits'])
+        add("\n" + self._generate_commit_type_pie_chart(conv_commits['commit_types'], total_typed))
         
-        report += f"""
+        add(f"""
 ---
 
 ## 💰 Business Value & Cost Savings
 
 ### Estimated Cost Savings
-- 🐛 **Bug Fixes:** {self._format_currency(business['estimated_cost_savings']['bug_fixes'])}
-- ⚡ **Performance Improvements:** {self._format_currency(business['estimated_cost_savings']['performance_improvements'])}
-- ✅ **Test Additions:** {self._format_currency(business['estimated_cost_savings']['test_additions'])}
-- 💵 **Total Estimated Savings:** {self._format_currency(business['estimated_cost_savings']['total'])}
+- 🐛 **Bug Fixes:** {self._format_currency(savings['bug_fixes'])}
+- ⚡ **Performance Improvements:** {self._format_currency(savings['performance_improvements'])}
+- ✅ **Test Additions:** {self._format_currency(savings['test_additions'])}
+- 💵 **Total Estimated Savings:** {self._format_currency(savings['total'])}
 
 > **Note:** Cost estimates based on industry averages for time saved through automation, bug fixes, and performance improvements.
 
 ### 🚀 Velocity & Productivity
-- ✅ **Merge Rate:** {business['velocity_metrics']['merged_rate']:.1f}%
-- ⏰ **Average PR Cycle Time:** {self._format_time(business['velocity_metrics']['avg_time_to_close_hours'])}
-- 📝 **Average Lines Changed per PR:** {business['productivity_metrics']['avg_lines_per_pr']:.0f}
-- 📊 **Total Code Changes:** {business['productivity_metrics']['total_code_changes']:,} lines
+- ✅ **Merge Rate:** {velocity['merged_rate']:.1f}%
+- ⏰ **Average PR Cycle Time:** {self._format_time(velocity['avg_time_to_close_hours'])}
+- 📝 **Average Lines Changed per PR:** {productivity['avg_lines_per_pr']:.0f}
+- 📊 **Total Code Changes:** {productivity['total_code_changes']:,} lines
 
 ---
 
@@ -384,10 +506,10 @@ xychart
 
  - 🔖 **GitHub Issues Referenced:** {work_items['total_github_issues']}
  - 📋 **Jira Tickets Referenced:** {work_items['total_jira_tickets']}
- - ✅ **PRs with Work Items:** {work_items['prs_with_work_items']} ({work_items['percentage_with_work_items']:.1f}%)
+ - ✅ **PRs with Work Items:** {work_items['prs_with_work_items']} ({work_item_pct:.1f}%)
  - ⚠️ **PRs without Work Items:** {work_items['prs_without_work_items']}
 
-> **Insight:** {work_items['percentage_with_work_items']:.1f}% of PRs are linked to tracked work items, indicating {"strong 💪" if work_items['percentage_with_work_items'] >= 70 else "moderate 👍" if work_items['percentage_with_work_items'] >= 40 else "limited 📉"} traceability between code changes and requirements.
+> **Insight:** {work_item_pct:.1f}% of PRs are linked to tracked work items, indicating {"strong 💪" if work_item_pct >= 70 else "moderate 👍" if work_item_pct >= 40 else "limited 📉"} traceability between code changes and requirements.
 
 ---
 
@@ -401,53 +523,50 @@ xychart
 ---
 
 ## 📦 Repository Contributions
-"""
+""")
 
-        for repo, count in list(repos_by_count.items())[:10]:
-            report += f"- **{repo}:** {count} PRs\n"
+        for repo, count in islice(repos_by_count.items(), 10):
+            add(f"- **{repo}:** {count} PRs\n")
 
         # Add treemap for repo contributions
         if analyzer_by_repo:
-            report += "\n### 🗺️ Commit Types by Repository\n\n"
-            report += self._generate_repo_treemap(analyzer_by_repo)
+            add("\n### 🗺️ Commit Types by Repository\n\n")
+            add(self._generate_repo_treemap(analyzer_by_repo))
 
-        report += "\n---\n\n## 📅 Monthly Activity\n\n"
+        add("\n---\n\n## 📅 Monthly Activity\n\n")
         
         prs_per_month = aggregated_analyzer.get_prs_per_month()
         
         # Add monthly throughput chart
-        report += self._generate_monthly_throughput_chart(prs_per_month)
+        add(self._generate_monthly_throughput_chart(prs_per_month))
         
-        report += "| Month | Count |\n|-------|-------|\n"
-        for month, count in prs_per_month.items():
-            report += f"| {month} | {count} |\n"
+        add("| Month | Count |\n|-------|-------|\n")
+        add("".join(f"| {month} | {count} |\n" for month, count in prs_per_month.items()))
 
-        report += "\n---\n\n## 💡 Key Insights\n\n"
+        add("\n---\n\n## 💡 Key Insights\n\n")
 
         # Generate insights
         if avg_time:
             if avg_time < 24:
-                report += "- ✅ **Fast PR turnaround:** PRs are closed quickly (< 1 day on average).\n"
+                add("- ✅ **Fast PR turnaround:** PRs are closed quickly (< 1 day on average).\n")
             elif avg_time < 168:
-                report += "- ✓ **Moderate PR turnaround:** PRs are closed within a week on average.\n"
+                add("- ✓ **Moderate PR turnaround:** PRs are closed within a week on average.\n")
             else:
-                report += "- ⚠️ **Slow PR turnaround:** Consider reviewing bottlenecks.\n"
+                add("- ⚠️ **Slow PR turnaround:** Consider reviewing bottlenecks.\n")
 
-        merge_rate = aggregated_analyzer.get_merged_prs_count() / max(aggregated_analyzer.get_total_prs(), 1) * 100
         if merge_rate > 80:
-            report += "- ✅ **High merge rate:** Most PRs are successfully merged.\n"
+            add("- ✅ **High merge rate:** Most PRs are successfully merged.\n")
         elif merge_rate < 50:
-            report += "- ⚠️ **Low merge rate:** Review PR quality and contribution guidelines.\n"
+            add("- ⚠️ **Low merge rate:** Review PR quality and contribution guidelines.\n")
 
-        if conv_commits['percentage_with_conventional'] > 70:
-            report += "- ✅ **Strong conventional commit adoption:** Good standardization of commit messages.\n"
-        elif conv_commits['percentage_with_conventional'] < 30:
-            report += "- ⚠️ **Limited conventional commit usage:** Consider adopting conventional commits for better changelog generation.\n"
+        if conventional_pct > 70:
+            add("- ✅ **Strong conventional commit adoption:** Good standardization of commit messages.\n")
+        elif conventional_pct < 30:
+            add("- ⚠️ **Limited conventional commit usage:** Consider adopting conventional commits for better changelog generation.\n")
 
         # Save report
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(report)
+        with self._open_output(output_path) as f:
+            f.writelines(parts)
 
     def generate_monthly_breakdown_by_repo(
         self, monthly_data_by_repo: Dict[str, Dict[str, Dict[str, Any]]], output_path: str
@@ -459,38 +578,40 @@ xychart
             monthly_data_by_repo: Monthly data organized by repository
             output_path: Path to save the report
         """
-        report = f"""# 📅 Monthly Breakdown - {self.year} (By Repository)
-
-**Organization:** {self.org}  
-**User:** {self.user}  
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
----
-
-"""
+        parts: List[str] = []
+        add = parts.append
+        fmt = self._format_time
+        kv = self._render_kv
+        add(self._report_header("📅 Monthly Breakdown", "By Repository"))
 
         for repo, monthly_data in monthly_data_by_repo.items():
-            report += f"## 📦 {repo}\n\n"
+            # Leave out repositories and months without any PRs
+            if not any(data['total_prs'] for data in monthly_data.values()):
+                continue
+            add(f"## 📦 {repo}\n\n")
             
             for month, data in monthly_data.items():
-                month_name = datetime.strptime(month, "%Y-%m").strftime("%B %Y")
-                report += f"### 📆 {month_name}\n\n"
-                report += f"- 🔢 **Total PRs:** {data['total_prs']}\n"
-                report += f"- ✅ **Merged:** {data['merged']}\n"
-                report += f"- ⏰ **Avg Time to Close:** {self._format_time(data['avg_time_to_close_hours'])}\n"
+                if not data['total_prs']:
+                    continue
+                month_name = f"{MONTH_NAMES[int(month[5:7]) - 1]} {month[:4]}"
+                add(f"### 📆 {month_name}\n\n")
+                add(kv([
+                    ("🔢", "Total PRs", data['total_prs']),
+                    ("✅", "Merged", data['merged']),
+                    ("⏰", "Avg Time to Close", fmt(data['avg_time_to_close_hours'])),
+                ]))
                 
                 if 'conventional_commits' in data:
                     conv = data['conventional_commits']
-                    report += f"- 📝 **Conventional Commits:** {conv['prs_with_conventional_commits']} PRs\n"
+                    add(f"- 📝 **Conventional Commits:** {conv['prs_with_conventional_commits']} PRs\n")
                 
-                report += "\n"
+                add("\n")
             
-            report += "---\n\n"
+            add("---\n\n")
 
         # Save report
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(report)
+        with self._open_output(output_path) as f:
+            f.writelines(parts)
 
     def generate_monthly_breakdown_aggregated(
         self, monthly_data: Dict[str, Dict[str, Any]], output_path: str
@@ -502,49 +623,24 @@ xychart
             monthly_data: Aggregated monthly statistics
             output_path: Path to save the report
         """
-        report = f"""# 📅 Monthly Breakdown - {self.year} (Aggregated)
-
-**Organization:** {self.org}  
-**User:** {self.user}  
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
----
-
-"""
+        parts: List[str] = []
+        add = parts.append
+        fmt = self._format_time
+        add(self._report_header("📅 Monthly Breakdown", "Aggregated"))
 
         for month, data in monthly_data.items():
-            month_name = datetime.strptime(month, "%Y-%m").strftime("%B %Y")
-            report += f"## 📆 {month_name}\n\n"
-
-            report += f"### 📊 Overview\n"
-            report += f"- 🔢 **Total PRs:** {data['total_prs']}\n"
-            report += f"- ✅ **Merged:** {data['merged']}\n"
-            report += f"- ❌ **Closed (not merged):** {data['closed_not_merged']}\n"
-            report += f"- 🔓 **Still Open:** {data['still_open']}\n"
-            report += f"- ⏰ **Avg Time to Close:** {self._format_time(data['avg_time_to_close_hours'])}\n\n"
-
-            if 'conventional_commits' in data:
-                conv = data['conventional_commits']
-                report += f"### 🏷️ Conventional Commits\n"
-                report += f"- 📝 **PRs with Conventional Commits:** {conv['prs_with_conventional_commits']}\n"
-                report += f"- ✨ **Feat Count:** {conv['feat_count']}\n"
-                report += f"- 🐛 **Fix Count:** {conv['fix_count']}\n\n"
-
-            report += f"### 🔗 Work Items\n"
-            work_items = data["work_items"]
-            report += f"- 🔖 **GitHub Issues:** {work_items['total_github_issues']}\n"
-            report += f"- 📋 **Jira Tickets:** {work_items['total_jira_tickets']}\n"
-            report += f"- ✅ **PRs with Work Items:** {work_items['prs_with_work_items']} ({work_items['percentage_with_work_items']:.1f}%)\n\n"
-
-            report += f"### 💻 Code Changes\n"
-            code = data["code_changes"]
-            report += f"- ➕ **Lines Added:** {code['total_additions']:,}\n"
-            report += f"- ➖ **Lines Deleted:** {code['total_deletions']:,}\n"
-            report += f"- 📄 **Files Changed:** {code['total_files_changed']:,}\n\n"
-
-            report += "\n---\n\n"
+            if not data['total_prs']:
+                continue
+            conv = data.get('conventional_commits')
+            add(MONTHLY_SECTION_TEMPLATE.format_map({
+                **data,
+                **data["work_items"],
+                **data["code_changes"],
+                "month_name": f"{MONTH_NAMES[int(month[5:7]) - 1]} {month[:4]}",
+                "avg_time": fmt(data['avg_time_to_close_hours']),
+                "conventional": MONTHLY_CONVENTIONAL_TEMPLATE.format_map(conv) if conv else "",
+            }))
 
         # Save report
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(report)
+        with self._open_output(output_path) as f:
+            f.writelines(parts)
@@ -2,7 +2,8 @@
 
 import pytest
 from datetime import datetime
-from github_pr_review.analyzer import PRAnalyzer
+from unittest.mock import patch
+from github_pr_review.analyzer import PRAnalyzer, _extract_work_item_sets, _match_commit_type
 
 
 @pytest.fixture
@@ -129,6 +130,20 @@ def test_get_prs_per_month(sample_pr_data):
     assert prs_per_month["2024-03"] == 1
 
 
+def test_get_prs_per_month_chronological_order(sample_pr_data):
+    """Test that months spanning a year boundary come out in order."""
+    created = [datetime(2024, 3, 1), datetime(2023, 12, 5), datetime(2024, 3, 9), datetime(2023, 10, 2)]
+    for pr, created_at in zip(sample_pr_data, created):
+        pr["created_at"] = created_at
+    analyzer = PRAnalyzer(sample_pr_data)
+    assert list(analyzer.get_prs_per_month().items()) == [
+        ("2023-10", 1),
+        ("2023-12", 1),
+        ("2024-03", 2),
+    ]
+    assert list(analyzer.get_monthly_breakdown()) == ["2023-10", "2023-12", "2024-03"]
+
+
 def test_get_prs_by_author(sample_pr_data):
     """Test counting PRs by author."""
     analyzer = PRAnalyzer(sample_pr_data)
@@ -138,6 +153,32 @@ def test_get_prs_by_author(sample_pr_data):
     assert prs_by_author["user3"] == 1
 
 
+def test_get_prs_by_author_top_n(sample_pr_data):
+    """Test limiting the author counts to the most active authors."""
+    analyzer = PRAnalyzer(sample_pr_data)
+    assert analyzer.get_prs_by_author(top_n=1) == {"user1": 2}
+    assert len(analyzer.get_prs_by_author(top_n=2)) == 2
+
+
+def test_get_prs_by_repo(sample_pr_data):
+    """Test counting PRs by repository, most active first."""
+    for pr, repo in zip(sample_pr_data, ["owner/api", "owner/web", "owner/web"]):
+        pr["repo"] = repo
+    analyzer = PRAnalyzer(sample_pr_data)
+    assert list(analyzer.get_prs_by_repo().items()) == [("owner/web", 2), ("owner/api", 1)]
+
+
+def test_cached_properties_match_getters(sample_pr_data):
+    """Test that derived metrics are exposed as cached properties."""
+    analyzer = PRAnalyzer(sample_pr_data)
+    assert analyzer.total_prs == analyzer.get_total_prs() == 4
+    assert analyzer.merged_prs_count == analyzer.get_merged_prs_count()
+    assert analyzer.prs_by_author == analyzer.get_prs_by_author()
+    assert analyzer.prs_per_month == analyzer.get_prs_per_month()
+    assert analyzer.monthly_breakdown is analyzer.get_monthly_breakdown()
+    assert analyzer.code_change_stats is analyzer.get_code_change_stats()
+
+
 def test_extract_work_items_github_issue():
     """Test extracting GitHub issue references."""
     analyzer = PRAnalyzer([])
@@ -172,6 +213,42 @@ def test_extract_work_items_jira_url():
     assert "ABC-999" in work_items["jira_tickets"]
 
 
+def test_extract_work_items_jira_key_in_issue_url():
+    """Test that a Jira key in an issue URL's path is still reported."""
+    analyzer = PRAnalyzer([])
+    description = "See https://github.com/MyOrg/PROJ-1/issues/3"
+    work_items = analyzer.extract_work_items(description)
+    assert work_items["github_issues"] == ["3"]
+    assert work_items["jira_tickets"] == ["PROJ-1"]
+
+
+def test_extract_work_items_without_references():
+    """Test descriptions without any reference markers."""
+    analyzer = PRAnalyzer([])
+    work_items = analyzer.extract_work_items("Documentation update")
+    assert work_items == {"github_issues": [], "jira_tickets": []}
+
+
+def test_extract_work_items_mixed_references():
+    """Test extracting every reference kind from a single description."""
+    analyzer = PRAnalyzer([])
+    description = (
+        "Fixes #12 and PROJ-4, see https://github.com/owner/repo/issues/77 "
+        "and https://company.atlassian.net/browse/ABC-9 (again #12)"
+    )
+    work_items = analyzer.extract_work_items(description)
+    assert work_items["github_issues"] == ["12", "77"]
+    assert work_items["jira_tickets"] == ["ABC-9", "PROJ-4"]
+
+
+def test_extract_work_items_long_uppercase_text():
+    """Test that long uppercase runs don't hide or slow down Jira keys."""
+    analyzer = PRAnalyzer([])
+    description = "ABCDEF" * 3000 + " fixes PROJ-1 and xyzABC-2 - done"
+    work_items = analyzer.extract_work_items(description)
+    assert work_items["jira_tickets"] == ["ABC-2", "PROJ-1"]
+
+
 def test_get_work_item_analysis(sample_pr_data):
     """Test work item analysis."""
     analyzer = PRAnalyzer(sample_pr_data)
@@ -195,6 +272,44 @@ def test_get_code_change_stats(sample_pr_data):
     assert stats["avg_files_per_pr"] == 4.5
 
 
+def test_summary_scans_prs_once(sample_pr_data):
+    """Test that aggregate getters share a single pass over the PR data."""
+    analyzer = PRAnalyzer(sample_pr_data)
+    with patch(
+        "github_pr_review.analyzer._extract_work_item_sets", wraps=_extract_work_item_sets
+    ) as extract:
+        analyzer.get_merged_prs_count()
+        analyzer.get_average_time_to_close()
+        analyzer.get_code_change_stats()
+        analyzer.get_work_item_analysis()
+        analyzer.get_monthly_breakdown()
+        analyzer.get_prs_by_repo()
+        analyzer.get_business_insights()
+    assert extract.call_count == len(sample_pr_data)
+
+
+def test_combine_merges_statistics_without_rescanning(sample_pr_data):
+    """Test that a combined analyzer matches one built over all PRs."""
+    expected = PRAnalyzer(sample_pr_data)
+    parts = [PRAnalyzer(sample_pr_data[:1]), PRAnalyzer(sample_pr_data[1:])]
+    for analyzer in [expected, *parts]:
+        analyzer.get_merged_prs_count()
+
+    with patch(
+        "github_pr_review.analyzer._extract_work_item_sets", wraps=_extract_work_item_sets
+    ) as extract:
+        combined = PRAnalyzer.combine(parts)
+        assert combined.get_total_prs() == expected.get_total_prs()
+        assert combined.get_median_time_to_close() == expected.get_median_time_to_close()
+        assert combined.get_work_item_analysis() == expected.get_work_item_analysis()
+        assert combined.get_conventional_commits_analysis() == expected.get_conventional_commits_analysis()
+        assert combined.get_prs_by_author() == expected.get_prs_by_author()
+        assert combined.get_monthly_breakdown() == expected.get_monthly_breakdown()
+        assert combined.get_business_insights() == expected.get_business_insights()
+    assert extract.call_count == 0
+    assert combined.pr_data == sample_pr_data
+
+
 def test_get_monthly_breakdown(sample_pr_data):
     """Test monthly breakdown generation."""
     analyzer = PRAnalyzer(sample_pr_data)
@@ -205,6 +320,13 @@ def test_get_monthly_breakdown(sample_pr_data):
     assert monthly["2024-01"]["total_prs"] == 2
     assert monthly["2024-02"]["total_prs"] == 1
     assert monthly["2024-03"]["total_prs"] == 1
+    assert monthly["2024-01"]["merged"] == 2
+    assert monthly["2024-02"]["closed_not_merged"] == 1
+    assert monthly["2024-03"]["still_open"] == 1
+    assert monthly["2024-01"]["avg_time_to_close_hours"] == 14.5
+    assert monthly["2024-01"]["code_changes"]["total_additions"] == 150
+    assert monthly["2024-01"]["work_items"]["prs_with_work_items"] == 2
+    assert monthly["2024-01"]["top_authors"] == {"user1": 1, "user2": 1}
 
 
 def test_empty_pr_list():
@@ -323,6 +445,30 @@ def test_business_insights():
     assert business["estimated_cost_savings"]["bug_fixes"] > 0
 
 
+def test_commit_type_prefix_matching_matches_pattern():
+    """Test that the prefix lookup agrees with COMMIT_TYPE_PATTERN."""
+    texts = [
+        "feat: add thing",
+        "Fix(api): handle nulls",
+        "docs: readme",
+        "DOC: typo",
+        "hotfix: urgent",
+        "features are great",
+        "ci: pipeline",
+        "cinema",
+        "Merge pull request #1",
+        "Update README",
+        "",
+    ]
+    for text in texts:
+        match = PRAnalyzer.COMMIT_TYPE_PATTERN.match(text)
+        expected = None
+        if match:
+            raw_type = match.group(1).lower()
+            expected = PRAnalyzer.COMMIT_TYPE_ALIASES.get(raw_type, raw_type)
+        assert _match_commit_type(text) == expected, text
+
+
 def test_fuzzy_conventional_commit_matching():
     """Test that fuzzy conventional commit types are normalized correctly."""
     pr_data = [
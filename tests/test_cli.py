@@ -1,13 +1,17 @@
 """Tests for the CLI module."""
 
 import json
+import re
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 from pathlib import Path
 from click.testing import CliRunner
+from github.Issue import Issue
 
-from github_pr_review.cli import main
+from github_pr_review.cli import main, _fetch_repo_pr_data
+from github_pr_review.github_client import GitHubPRClient
 
 
 @pytest.fixture
@@ -68,38 +72,26 @@ def mock_github_client():
         mock_client = Mock()
         mock_client_class.return_value = mock_client
         
-        # Mock repository
-        mock_repo = Mock()
-        mock_repo.full_name = "test-org/test-repo"
-        
-        # Mock PR
-        mock_pr = Mock()
-        mock_pr.number = 1
-        mock_pr.title = "feat: add feature"
-        mock_pr.state = "closed"
-        mock_pr.created_at = datetime(2024, 1, 15, 10, 0)
-        mock_pr.closed_at = datetime(2024, 1, 16, 14, 0)
-        mock_pr.merged_at = datetime(2024, 1, 16, 14, 0)
-        mock_pr.merged = True
-        mock_pr.user = Mock()
-        mock_pr.user.login = "testuser"
-        mock_pr.body = "Test description #123"
-        
-        label = Mock()
-        label.name = "enhancement"
-        mock_pr.labels = [label]
-        mock_pr.html_url = "https://github.com/test-org/test-repo/pull/1"
-        mock_pr.additions = 100
-        mock_pr.deletions = 50
-        mock_pr.changed_files = 5
-        
-        # Mock commits
-        mock_commit = Mock()
-        mock_commit.commit.message = "feat: add feature"
-        mock_pr.get_commits.return_value = [mock_commit]
+        # Stand-in PR
+        mock_pr = SimpleNamespace(
+            number=1,
+            title="feat: add feature",
+            state="closed",
+            created_at=datetime(2024, 1, 15, 10, 0),
+            closed_at=datetime(2024, 1, 16, 14, 0),
+            merged_at=datetime(2024, 1, 16, 14, 0),
+            merged=True,
+            user=SimpleNamespace(login="testuser"),
+            body="Test description #123",
+            labels=[SimpleNamespace(name="enhancement")],
+            html_url="https://github.com/test-org/test-repo/pull/1",
+            additions=100,
+            deletions=50,
+            changed_files=5,
+            get_commits=lambda: [SimpleNamespace(commit=SimpleNamespace(message="feat: add feature"))],
+        )
         
-        mock_client.get_user_repos_in_org.return_value = [mock_repo]
-        mock_client.get_prs_for_user_in_repo.return_value = [mock_pr]
+        mock_client.get_user_prs_in_org.return_value = {"test-org/test-repo": [mock_pr]}
         mock_client.extract_pr_data.return_value = {
             "number": 1,
             "title": "feat: add feature",
@@ -220,41 +212,12 @@ def test_cli_pr_data_file_not_found(runner, tmp_path):
     assert "File not found" in result.output
 
 
-def test_cli_no_repos_found(runner, tmp_path):
-    """Test CLI when no repositories are found."""
-    with patch("github_pr_review.cli.GitHubPRClient") as mock_client_class:
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.get_user_repos_in_org.return_value = []
-        
-        output_dir = tmp_path / "reports"
-        
-        result = runner.invoke(
-            main,
-            [
-                "test-org",
-                "test-user",
-                "--year", "2024",
-                "--token", "test_token",
-                "--output-dir", str(output_dir)
-            ]
-        )
-        
-        assert result.exit_code == 0
-        assert "No repositories found" in result.output
-
-
 def test_cli_no_prs_found(runner, tmp_path):
     """Test CLI when no PRs are found."""
     with patch("github_pr_review.cli.GitHubPRClient") as mock_client_class:
         mock_client = Mock()
         mock_client_class.return_value = mock_client
-        
-        mock_repo = Mock()
-        mock_repo.full_name = "test-org/test-repo"
-        
-        mock_client.get_user_repos_in_org.return_value = [mock_repo]
-        mock_client.get_prs_for_user_in_repo.return_value = []
+        mock_client.get_user_prs_in_org.return_value = {}
         
         output_dir = tmp_path / "reports"
         
@@ -401,6 +364,33 @@ def test_cli_datetime_parsing_from_json(runner, tmp_path):
     assert "Reports generated successfully" in result.output
 
 
+def test_cli_datetime_parsing_zulu_suffix(runner, sample_pr_data, tmp_path):
+    """Test that GitHub-style timestamps with a trailing Z are parsed."""
+    for pr in sample_pr_data:
+        for field in ("created_at", "closed_at", "merged_at"):
+            pr[field] += "Z"
+
+    pr_data_file = tmp_path / "pr-data.json"
+    with open(pr_data_file, 'w') as f:
+        json.dump(sample_pr_data, f)
+
+    output_dir = tmp_path / "reports"
+
+    result = runner.invoke(
+        main,
+        [
+            "test-org",
+            "test-user",
+            "--year", "2024",
+            "--output-dir", str(output_dir),
+            "--pr-data-file", str(pr_data_file)
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert "Reports generated successfully" in result.output
+
+
 def test_cli_multiple_repositories(runner, sample_pr_data, tmp_path):
     """Test CLI with PRs from multiple repositories."""
     # Add PRs from another repo
@@ -474,6 +464,78 @@ def test_cli_raw_pr_data_serialization(runner, mock_github_client, tmp_path):
         assert "repository" in data[0]
 
 
+@pytest.mark.parametrize("flags, fetch_commits", [([], True), (["--no-commits"], False)])
+def test_cli_no_commits_flag(runner, mock_github_client, tmp_path, flags, fetch_commits):
+    """Test that --no-commits stops commit messages being fetched."""
+    result = runner.invoke(
+        main,
+        [
+            "test-org",
+            "test-user",
+            "--year", "2024",
+            "--token", "test_token",
+            "--output-dir", str(tmp_path / "reports"),
+            *flags,
+        ]
+    )
+
+    assert result.exit_code == 0
+    mock_github_client.get_pr_details.assert_called_once_with(
+        "test-org/test-repo", [1], fetch_commits=fetch_commits
+    )
+    assert mock_github_client.extract_pr_data.call_args.kwargs["fetch_commits"] is fetch_commits
+
+
+def test_cli_concurrent_fetch_keeps_repository_order(runner, tmp_path):
+    """Test that concurrently fetched repos are collected in repository order."""
+    with patch("github_pr_review.cli.GitHubPRClient") as mock_client_class:
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+
+        mock_client.get_user_prs_in_org.return_value = {
+            name: [Mock(number=1)] for name in ["test-org/a", "test-org/b", "test-org/c"]
+        }
+        mock_client.get_pr_details.return_value = {1: {"commit_messages": ["feat: add feature"]}}
+        mock_client.extract_pr_data.side_effect = lambda pr, repo_name, details, fetch_commits: {
+            "number": 1,
+            "title": "feat: add feature",
+            "state": "open",
+            "created_at": datetime(2024, 1, 15, 10, 0),
+            "closed_at": None,
+            "merged_at": None,
+            "merged": False,
+            "author": "testuser",
+            "description": "",
+            "labels": [],
+            "time_to_close_hours": None,
+            "url": f"https://github.com/{repo_name}/pull/1",
+            "additions": 1,
+            "deletions": 1,
+            "changed_files": 1,
+            "commit_messages": details["commit_messages"],
+            "repo": repo_name,
+        }
+
+        output_dir = tmp_path / "reports"
+        result = runner.invoke(
+            main,
+            [
+                "test-org",
+                "test-user",
+                "--year", "2024",
+                "--token", "test_token",
+                "--output-dir", str(output_dir),
+                "--max-workers", "2",
+            ],
+        )
+
+    assert result.exit_code == 0
+    assert "Found 3 pull requests across 3 repositories" in result.output
+    with open(output_dir / "test-org-test-user-2024-raw-pr-data.json") as f:
+        data = json.load(f)
+    assert [pr["repo"] for pr in data] == ["test-org/a", "test-org/b", "test-org/c"]
+
+
 def test_cli_help(runner):
     """Test CLI help output."""
     result = runner.invoke(main, ["--help"])
@@ -485,4 +547,60 @@ def test_cli_help(runner):
     assert "--token" in result.output
     assert "--output-dir" in result.output
     assert "--pr-data-file" in result.output
+    assert "--max-workers" in result.output
+    assert "--no-commits" in result.output
+
+
+def test_fetch_repo_pr_data_request_count():
+    """A user's PRs cost one search plus one details query per batch, not requests per PR."""
+    issues = [
+        Mock(
+            spec=Issue,
+            repository_url="https://api.github.com/repos/test-org/repo",
+            number=number,
+            title=f"feat: change {number}",
+            state="closed",
+            created_at=datetime(2024, 3, 1, 9, 0),
+            closed_at=datetime(2024, 3, 1, 10, 0),
+            user=SimpleNamespace(login="testuser"),
+            body="",
+            labels=[],
+            html_url=f"https://github.com/test-org/repo/pull/{number}",
+        )
+        for number in range(1, 31)
+    ]
 
+    def graphql_query(query, variables):
+        pull_request = {
+            "merged": True,
+            "mergedAt": "2024-03-01T10:00:00Z",
+            "additions": 5,
+            "deletions": 2,
+            "changedFiles": 1,
+            "commits": {
+                "nodes": [{"commit": {"message": "feat: change"}}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            },
+        }
+        numbers = re.findall(r"pr(\d+): pullRequest", query)
+        return {}, {"data": {"repository": {f"pr{number}": pull_request for number in numbers}}}
+
+    with patch("github_pr_review.github_client.Github") as mock_github_class:
+        mock_github = mock_github_class.return_value
+        mock_github.search_issues.return_value = issues
+        mock_github.requester.graphql_query.side_effect = graphql_query
+
+        client = GitHubPRClient("test_token")
+        prs_by_repo = client.get_user_prs_in_org("test-org", "testuser", 2024)
+        pr_data = _fetch_repo_pr_data(client, "test-org/repo", prs_by_repo["test-org/repo"])
+
+    assert len(pr_data) == 30
+    assert all(pr["merged"] and pr["additions"] == 5 for pr in pr_data)
+    assert pr_data[0]["commit_messages"] == ["feat: change"]
+
+    batches = -(-len(issues) // GitHubPRClient.DETAILS_QUERY_BATCH_SIZE)
+    assert mock_github.search_issues.call_count == 1
+    assert mock_github.requester.graphql_query.call_count == batches
+    mock_github.get_organization.assert_not_called()
+    for issue in issues:
+        issue.as_pull_request.assert_not_called()
@@ -1,52 +1,83 @@
 """Tests for the GitHubPRClient class."""
 
+import re
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from datetime import datetime, timezone
-from github.GithubException import GithubException
+from github.GithubException import GithubException, RateLimitExceededException
+from github.Issue import Issue
+from github_pr_review import github_client
 from github_pr_review.github_client import GitHubPRClient
 
 
+def fake_pr(**fields):
+    """Create a stand-in PullRequest with just the given attributes."""
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_github():
+    """Patch the PyGithub client once for every test in the module."""
+    with patch.object(github_client, "Github") as mock_github_class:
+        yield mock_github_class
+
+
 @pytest.fixture
-def mock_pr():
-    """Create a mock PullRequest object."""
-    pr = Mock()
-    pr.number = 123
-    pr.title = "Test PR"
-    pr.state = "closed"
-    pr.created_at = datetime(2024, 1, 15, 10, 0)
-    pr.closed_at = datetime(2024, 1, 16, 14, 0)
-    pr.merged_at = datetime(2024, 1, 16, 14, 0)
-    pr.merged = True
-    pr.user = Mock()
-    pr.user.login = "testuser"
-    pr.body = "Test description with #123"
-    # Create label mocks with name attributes
-    label1 = Mock()
-    label1.name = "bug"
-    label2 = Mock()
-    label2.name = "enhancement"
-    pr.labels = [label1, label2]
-    pr.html_url = "https://github.com/owner/repo/pull/123"
-    pr.additions = 100
-    pr.deletions = 50
-    pr.changed_files = 5
-    return pr
-
-
-def test_client_initialization_with_token():
+def mock_github_class(_patch_github):
+    """The patched PyGithub class, with any previous test's setup cleared."""
+    _patch_github.reset_mock(return_value=True, side_effect=True)
+    return _patch_github
+
+
+@pytest.fixture(scope="module")
+def pr_fields():
+    """Attribute values of the stand-in PullRequest, built once per module."""
+    return dict(
+        number=123,
+        title="Test PR",
+        state="closed",
+        created_at=datetime(2024, 1, 15, 10, 0),
+        closed_at=datetime(2024, 1, 16, 14, 0),
+        merged_at=datetime(2024, 1, 16, 14, 0),
+        merged=True,
+        user=SimpleNamespace(login="testuser"),
+        body="Test description with #123",
+        labels=[SimpleNamespace(name="bug"), SimpleNamespace(name="enhancement")],
+        html_url="https://github.com/owner/repo/pull/123",
+        additions=100,
+        deletions=50,
+        changed_files=5,
+    )
+
+
+@pytest.fixture
+def mock_pr(pr_fields):
+    """Create a stand-in PullRequest object."""
+    return SimpleNamespace(
+        **pr_fields,
+        # Kept as a Mock so tests can stub and assert on commit lookups
+        get_commits=Mock(return_value=[]),
+    )
+
+
+def test_client_initialization_with_token(mock_github_class):
     """Test client initialization with token."""
-    with patch("github_pr_review.github_client.Github") as mock_github:
-        client = GitHubPRClient("test_token")
-        mock_github.assert_called_once_with("test_token")
+    client = GitHubPRClient("test_token")
+    mock_github_class.assert_called_once_with("test_token", per_page=100, pool_size=None)
 
 
-def test_client_initialization_without_token():
+def test_client_initialization_without_token(mock_github_class):
     """Test client initialization without token - now requires token."""
-    with patch("github_pr_review.github_client.Github") as mock_github:
-        # Token is now required
-        client = GitHubPRClient("test_token")
-        mock_github.assert_called_once_with("test_token")
+    # Token is now required
+    client = GitHubPRClient("test_token")
+    mock_github_class.assert_called_once_with("test_token", per_page=100, pool_size=None)
+
+
+def test_client_initialization_with_pool_size(mock_github_class):
+    """Test that the connection pool can be sized for concurrent use."""
+    GitHubPRClient("test_token", pool_size=8)
+    mock_github_class.assert_called_once_with("test_token", per_page=100, pool_size=8)
 
 
 def test_extract_pr_data(mock_pr):
@@ -70,22 +101,23 @@ def test_extract_pr_data(mock_pr):
 
 def test_extract_pr_data_open_pr():
     """Test PR data extraction for open PR."""
-    pr = Mock()
-    pr.number = 456
-    pr.title = "Open PR"
-    pr.state = "open"
-    pr.created_at = datetime(2024, 1, 15, 10, 0)
-    pr.closed_at = None
-    pr.merged_at = None
-    pr.merged = False
-    pr.user = Mock()
-    pr.user.login = "user2"
-    pr.body = None
-    pr.labels = []
-    pr.html_url = "https://github.com/owner/repo/pull/456"
-    pr.additions = 20
-    pr.deletions = 10
-    pr.changed_files = 2
+    pr = fake_pr(
+        number=456,
+        title="Open PR",
+        state="open",
+        created_at=datetime(2024, 1, 15, 10, 0),
+        closed_at=None,
+        merged_at=None,
+        merged=False,
+        user=SimpleNamespace(login="user2"),
+        body=None,
+        labels=[],
+        html_url="https://github.com/owner/repo/pull/456",
+        additions=20,
+        deletions=10,
+        changed_files=2,
+        get_commits=lambda: [],
+    )
 
     client = GitHubPRClient(None)
     data = client.extract_pr_data(pr)
@@ -100,21 +132,23 @@ def test_extract_pr_data_open_pr():
 
 def test_extract_pr_data_no_user():
     """Test PR data extraction when user is None."""
-    pr = Mock()
-    pr.number = 789
-    pr.title = "No user PR"
-    pr.state = "closed"
-    pr.created_at = datetime(2024, 1, 15, 10, 0)
-    pr.closed_at = datetime(2024, 1, 15, 11, 0)
-    pr.merged_at = None
-    pr.merged = False
-    pr.user = None
-    pr.body = "Test"
-    pr.labels = []
-    pr.html_url = "https://github.com/owner/repo/pull/789"
-    pr.additions = 5
-    pr.deletions = 3
-    pr.changed_files = 1
+    pr = fake_pr(
+        number=789,
+        title="No user PR",
+        state="closed",
+        created_at=datetime(2024, 1, 15, 10, 0),
+        closed_at=datetime(2024, 1, 15, 11, 0),
+        merged_at=None,
+        merged=False,
+        user=None,
+        body="Test",
+        labels=[],
+        html_url="https://github.com/owner/repo/pull/789",
+        additions=5,
+        deletions=3,
+        changed_files=1,
+        get_commits=lambda: [],
+    )
 
     client = GitHubPRClient(None)
     data = client.extract_pr_data(pr)
@@ -122,7 +156,6 @@ def test_extract_pr_data_no_user():
     assert data["author"] is None
 
 
-@patch("github_pr_review.github_client.Github")
 def test_get_prs_for_year_with_year(mock_github_class):
     """Test fetching PRs for a specific year."""
     # Setup mock
@@ -138,29 +171,18 @@ def test_get_prs_for_year_with_year(mock_github_class):
     mock_pr2 = Mock()
     mock_pr2.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-    # Mock closed PRs
-    mock_closed_prs = Mock()
-    mock_closed_prs.__iter__ = Mock(return_value=iter([mock_pr1]))
-    mock_repo.get_pulls.return_value = mock_closed_prs
+    # Closed and open PRs are listed separately
+    prs_by_state = {"closed": [mock_pr1], "open": [mock_pr2]}
+    mock_repo.get_pulls.side_effect = lambda state, **_: prs_by_state[state]
 
     client = GitHubPRClient("test_token")
 
-    # Mock the open PRs call to return empty
-    def get_pulls_side_effect(state, sort, direction):
-        if state == "closed":
-            return iter([mock_pr1])
-        else:
-            return iter([mock_pr2])
-
-    mock_repo.get_pulls.side_effect = get_pulls_side_effect
-
     prs = client.get_prs_for_year("owner", "repo", 2024)
 
     # Verify the repo was accessed correctly
     mock_github.get_repo.assert_called_once_with("owner/repo")
 
 
-@patch("github_pr_review.github_client.Github")
 def test_get_prs_for_year_without_year(mock_github_class):
     """Test fetching PRs for last 365 days."""
     # Setup mock
@@ -180,20 +202,54 @@ def test_get_prs_for_year_without_year(mock_github_class):
     mock_github.get_repo.assert_called_once_with("owner/repo")
 
 
-@patch("github_pr_review.github_client.Github")
+def test_get_user_repos_in_org_uses_search(mock_github_class):
+    """Find contributed repos from a single PR search without scanning repos."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+
+    issues = []
+    for repo_name in ["org/api", "org/web", "org/api"]:
+        issue = Mock()
+        issue.repository_url = f"https://api.github.com/repos/{repo_name}"
+        issues.append(issue)
+    mock_github.search_issues.return_value = issues
+    mock_github.get_repo.side_effect = lambda name: f"repo:{name}"
+
+    client = GitHubPRClient("token")
+    repos = client.get_user_repos_in_org("org", "target", 2024)
+
+    assert repos == ["repo:org/api", "repo:org/web"]
+    mock_github.search_issues.assert_called_once_with(
+        "is:pr author:target org:org created:2024-01-01..2024-12-31"
+    )
+    mock_github.get_organization.assert_not_called()
+
+
+def test_get_user_repos_in_org_raises_when_rate_limited(mock_github_class):
+    """A rate limited search is reported rather than retried as a slow scan."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    mock_github.search_issues.side_effect = RateLimitExceededException(403, "rate limited", None)
+
+    client = GitHubPRClient("token")
+    with pytest.raises(RateLimitExceededException):
+        client.get_user_repos_in_org("org", "target", 2024)
+
+    mock_github.get_organization.assert_not_called()
+
+
 def test_get_user_repos_in_org_org_success(mock_github_class):
     """Include repos when target user has authored PRs in the org."""
     mock_github = Mock()
     mock_github_class.return_value = mock_github
+    mock_github.search_issues.side_effect = GithubException(422, "search unavailable", None)
 
     mock_org = Mock()
     mock_github.get_organization.return_value = mock_org
 
     repo_matching = Mock()
     repo_matching.full_name = "org/repo"
-    pr = Mock()
-    pr.user = Mock()
-    pr.user.login = "target"
+    pr = fake_pr(user=SimpleNamespace(login="target"))
     repo_matching.get_pulls.return_value = [pr]
 
     repo_duplicate = Mock()
@@ -202,9 +258,7 @@ def test_get_user_repos_in_org_org_success(mock_github_class):
 
     repo_no_pr = Mock()
     repo_no_pr.full_name = "org/other"
-    pr2 = Mock()
-    pr2.user = Mock()
-    pr2.user.login = "other"
+    pr2 = fake_pr(user=SimpleNamespace(login="other"))
     repo_no_pr.get_pulls.return_value = [pr2]
 
     mock_org.get_repos.return_value = [repo_matching, repo_duplicate, repo_no_pr]
@@ -215,11 +269,11 @@ def test_get_user_repos_in_org_org_success(mock_github_class):
     assert repos == [repo_matching]
 
 
-@patch("github_pr_review.github_client.Github")
 def test_get_user_repos_in_org_fallback_to_user(mock_github_class):
     """Fall back to the authenticated user's repos when org lookup fails."""
     mock_github = Mock()
     mock_github_class.return_value = mock_github
+    mock_github.search_issues.side_effect = GithubException(422, "search unavailable", None)
 
     mock_github.get_organization.side_effect = GithubException(404, "org not found", None)
     mock_user = Mock()
@@ -227,9 +281,7 @@ def test_get_user_repos_in_org_fallback_to_user(mock_github_class):
 
     repo_via_user = Mock()
     repo_via_user.full_name = "user/repo"
-    pr = Mock()
-    pr.user = Mock()
-    pr.user.login = "target-user"
+    pr = fake_pr(user=SimpleNamespace(login="target-user"))
     repo_via_user.get_pulls.return_value = [pr]
     mock_user.get_repos.return_value = [repo_via_user]
 
@@ -239,11 +291,11 @@ def test_get_user_repos_in_org_fallback_to_user(mock_github_class):
     assert repos == [repo_via_user]
 
 
-@patch("github_pr_review.github_client.Github")
 def test_get_user_repos_in_org_skip_inaccessible(mock_github_class):
     """When a repo cannot be accessed, it should be skipped."""
     mock_github = Mock()
     mock_github_class.return_value = mock_github
+    mock_github.search_issues.side_effect = GithubException(422, "search unavailable", None)
 
     mock_org = Mock()
     mock_github.get_organization.return_value = mock_org
@@ -259,32 +311,130 @@ def test_get_user_repos_in_org_skip_inaccessible(mock_github_class):
     assert repos == []
 
 
-def test_get_prs_for_user_in_repo_year_range():
-    """Filter PRs by year and include only matching user."""
+def test_get_user_repos_in_org_scan_does_not_search_per_repo(mock_github_class):
+    """The fallback scan pages through each repo's PRs instead of searching per repo."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    mock_github.search_issues.side_effect = GithubException(422, "search unavailable", None)
+
+    mock_org = Mock()
+    mock_github.get_organization.return_value = mock_org
+    repo_with_prs = Mock()
+    repo_with_prs.full_name = "org/repo"
+    repo_with_prs.get_pulls.return_value = [fake_pr(user=SimpleNamespace(login="target"))]
+    repo_without_prs = Mock()
+    repo_without_prs.full_name = "org/other"
+    repo_without_prs.get_pulls.return_value = [fake_pr(user=SimpleNamespace(login="someone"))]
+    mock_org.get_repos.return_value = [repo_with_prs, repo_without_prs]
+
+    client = GitHubPRClient("token")
+    repos = client.get_user_repos_in_org("org", "target")
+
+    assert repos == [repo_with_prs]
+    mock_github.search_issues.assert_called_once_with("is:pr author:target org:org")
+    repo_with_prs.get_pulls.assert_called_once_with(state="all")
+    repo_without_prs.get_pulls.assert_called_once_with(state="all")
+
+
+def search_result(repo_name, **fields):
+    """Create a stand-in issue search result for a PR in the given repository."""
+    return Mock(spec=Issue, repository_url=f"https://api.github.com/repos/{repo_name}", **fields)
+
+
+def test_get_user_prs_in_org_groups_search_results(mock_github_class):
+    """One org-wide search finds the user's PRs, grouped by repository."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    issues = [
+        search_result(repo_name, number=number)
+        for number, repo_name in enumerate(["org/api", "org/web", "org/api"])
+    ]
+    mock_github.search_issues.return_value = issues
+
+    client = GitHubPRClient("token")
+    prs_by_repo = client.get_user_prs_in_org("org", "tester", 2023)
+
+    assert prs_by_repo == {"org/api": [issues[0], issues[2]], "org/web": [issues[1]]}
+    assert list(prs_by_repo) == ["org/api", "org/web"]
+    mock_github.search_issues.assert_called_once_with(
+        "is:pr author:tester org:org created:2023-01-01..2023-12-31"
+    )
+    mock_github.get_repo.assert_not_called()
+    mock_github.get_organization.assert_not_called()
+    for issue in issues:
+        issue.as_pull_request.assert_not_called()
+
+
+def test_get_user_prs_in_org_warns_at_search_result_limit(mock_github_class, monkeypatch, caplog):
+    """A search that hits the result cap is reported, since further PRs are dropped."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    monkeypatch.setattr(GitHubPRClient, "SEARCH_RESULT_LIMIT", 3)
+    client = GitHubPRClient("token")
+
+    mock_github.search_issues.return_value = [search_result("org/api") for _ in range(2)]
+    client.get_user_prs_in_org("org", "tester", 2023)
+    assert "maximum" not in caplog.text
+
+    mock_github.search_issues.return_value = [search_result("org/api") for _ in range(3)]
+    prs_by_repo = client.get_user_prs_in_org("org", "tester", 2023)
+    assert len(prs_by_repo["org/api"]) == 3
+    assert "Search returned the maximum of 3 results" in caplog.text
+
+
+def test_get_user_prs_in_org_falls_back_to_scanning(mock_github_class, caplog):
+    """When search is unavailable, each repository's PRs are listed instead."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    mock_github.search_issues.side_effect = GithubException(422, "unprocessable", None)
+
+    pr = fake_pr(
+        created_at=datetime(2023, 6, 1, tzinfo=timezone.utc), user=SimpleNamespace(login="tester")
+    )
     repo = Mock()
+    repo.full_name = "org/api"
+    repo.get_pulls.side_effect = lambda state, **_: [pr] if state in ("all", "closed") else []
+    mock_github.get_organization.return_value.get_repos.return_value = [repo]
 
-    target = "tester"
-    pr_closed = Mock()
-    pr_closed.created_at = datetime(2023, 6, 1, tzinfo=timezone.utc)
-    pr_closed.user = Mock()
-    pr_closed.user.login = target
+    client = GitHubPRClient("token")
+    prs_by_repo = client.get_user_prs_in_org("org", "tester", 2023)
+
+    assert prs_by_repo == {"org/api": [pr]}
+    assert "PR search in org failed" in caplog.text
 
-    pr_early = Mock()
-    pr_early.created_at = datetime(2022, 12, 31, tzinfo=timezone.utc)
-    pr_early.user = Mock()
-    pr_early.user.login = target
 
-    pr_open = Mock()
-    pr_open.created_at = datetime(2023, 11, 1, tzinfo=timezone.utc)
-    pr_open.user = Mock()
-    pr_open.user.login = target
+def test_get_user_prs_in_org_raises_when_rate_limited(mock_github_class):
+    """A rate limited search is reported rather than retried as a slow scan."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    mock_github.search_issues.side_effect = RateLimitExceededException(403, "rate limited", None)
+
+    client = GitHubPRClient("token")
+    with pytest.raises(RateLimitExceededException):
+        client.get_user_prs_in_org("org", "tester", 2023)
 
-    def pulls_side_effect(state, sort, direction):
-        if state == "closed":
-            return [pr_closed, pr_early]
-        return [pr_open]
+    mock_github.get_organization.assert_not_called()
+
+
+def test_get_prs_for_user_in_repo_year_range(mock_github_class):
+    """Filter PRs by year and include only matching user."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    repo = Mock()
 
-    repo.get_pulls.side_effect = pulls_side_effect
+    target = "tester"
+    pr_closed = fake_pr(
+        created_at=datetime(2023, 6, 1, tzinfo=timezone.utc), user=SimpleNamespace(login=target)
+    )
+    pr_early = fake_pr(
+        created_at=datetime(2022, 12, 31, tzinfo=timezone.utc), user=SimpleNamespace(login=target)
+    )
+    pr_open = fake_pr(
+        created_at=datetime(2023, 11, 1, tzinfo=timezone.utc), user=SimpleNamespace(login=target)
+    )
+
+    prs_by_state = {"closed": [pr_closed, pr_early], "open": [pr_open]}
+    repo.get_pulls.side_effect = lambda state, **_: prs_by_state[state]
 
     client = GitHubPRClient("token")
     prs = client.get_prs_for_user_in_repo(repo, target, 2023)
@@ -294,22 +444,28 @@ def test_get_prs_for_user_in_repo_year_range():
     assert pr_early not in prs
 
 
-def test_get_prs_for_user_in_repo_default_range():
+class FrozenDatetime(datetime):
+    """datetime whose now() is fixed at the start of 2025."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_get_prs_for_user_in_repo_default_range(mock_github_class, monkeypatch):
     """Use last 365 days when year is not provided."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
     repo = Mock()
     repo.get_pulls.return_value = []
+    monkeypatch.setattr(github_client, "datetime", FrozenDatetime)
 
     client = GitHubPRClient("token")
-    real_datetime = datetime
-
-    with patch("github_pr_review.github_client.datetime", wraps=real_datetime) as mock_datetime:
-        mock_datetime.now.return_value = real_datetime(2025, 1, 1, tzinfo=timezone.utc)
-        prs = client.get_prs_for_user_in_repo(repo, "user", None)
+    prs = client.get_prs_for_user_in_repo(repo, "user", None)
 
     assert prs == []
 
 
-@patch("github_pr_review.github_client.Github")
 def test_get_prs_for_year_raises_runtime_error(mock_github_class):
     mock_github = Mock()
     mock_github_class.return_value = mock_github
@@ -326,9 +482,7 @@ def test_get_prs_for_year_raises_runtime_error(mock_github_class):
 
 def test_extract_pr_data_commits_and_repo_name(mock_pr):
     """Ensure commit messages and provided repo name are captured."""
-    commit = Mock()
-    commit.commit = Mock()
-    commit.commit.message = "feat: add tests"
+    commit = SimpleNamespace(commit=SimpleNamespace(message="feat: add tests"))
     mock_pr.get_commits.return_value = [commit]
 
     client = GitHubPRClient("token")
@@ -346,3 +500,157 @@ def test_extract_pr_data_handles_commit_errors(mock_pr):
     data = client.extract_pr_data(mock_pr)
 
     assert data["commit_messages"] == []
+
+
+def test_extract_pr_data_uses_prefetched_details(mock_pr):
+    """Prefetched details skip the per-PR detail and commits requests."""
+    details = {
+        "merged": False,
+        "merged_at": None,
+        "additions": 7,
+        "deletions": 3,
+        "changed_files": 2,
+        "commit_messages": ["fix: batched"],
+    }
+    client = GitHubPRClient("token")
+    data = client.extract_pr_data(mock_pr, details=details)
+
+    assert data["merged"] is False
+    assert data["merged_at"] is None
+    assert data["additions"] == 7
+    assert data["deletions"] == 3
+    assert data["changed_files"] == 2
+    assert data["commit_messages"] == ["fix: batched"]
+    mock_pr.get_commits.assert_not_called()
+
+
+def test_extract_pr_data_completes_search_results_without_details(mock_pr, pr_fields):
+    """A search result Issue is only completed into its PullRequest when details are missing."""
+    issue = Mock(spec=Issue, **pr_fields)
+    issue.as_pull_request.return_value = mock_pr
+    client = GitHubPRClient("token")
+
+    details = {
+        "merged": True,
+        "merged_at": pr_fields["merged_at"],
+        "additions": 1,
+        "deletions": 2,
+        "changed_files": 3,
+        "commit_messages": [],
+    }
+    assert client.extract_pr_data(issue, details=details)["additions"] == 1
+    issue.as_pull_request.assert_not_called()
+
+    data = client.extract_pr_data(issue)
+    issue.as_pull_request.assert_called_once_with()
+    assert data["additions"] == 100
+    assert data["merged_at"] == pr_fields["merged_at"]
+
+
+def test_get_pr_details_batches_graphql_queries(mock_github_class, monkeypatch, caplog):
+    """PR details are fetched per batch of PRs, logging and skipping failed batches."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    monkeypatch.setattr(GitHubPRClient, "DETAILS_QUERY_BATCH_SIZE", 2)
+
+    pull_request = {
+        "merged": True,
+        "mergedAt": "2024-01-02T03:04:05Z",
+        "additions": 10,
+        "deletions": 4,
+        "changedFiles": 3,
+        "commits": {
+            "nodes": [
+                {"commit": {"message": "feat: a"}},
+                {"commit": {"message": "test: b"}},
+            ],
+            "pageInfo": {"hasNextPage": False, "endCursor": "c1"},
+        },
+    }
+    mock_github.requester.graphql_query.side_effect = [
+        ({}, {"data": {"repository": {"pr1": pull_request, "pr2": None}}}),
+        GithubException(502, "bad gateway", None),
+    ]
+
+    client = GitHubPRClient("token")
+    details = client.get_pr_details("org/repo", [1, 2, 3])
+
+    assert details == {
+        1: {
+            "merged": True,
+            "merged_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "additions": 10,
+            "deletions": 4,
+            "changed_files": 3,
+            "commit_messages": ["feat: a", "test: b"],
+        }
+    }
+    assert mock_github.requester.graphql_query.call_count == 2
+    _, variables = mock_github.requester.graphql_query.call_args.args
+    assert variables == {"owner": "org", "name": "repo"}
+    assert "Failed to fetch details for PRs [3] in org/repo" in caplog.text
+
+
+def test_get_pr_details_pages_through_commits(mock_github_class):
+    """Commits are requested within GraphQL's page size limit and paged through."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+
+    def commits_page(messages, cursor):
+        return {
+            "nodes": [{"commit": {"message": message}} for message in messages],
+            "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+        }
+
+    pull_request = {
+        "merged": True,
+        "mergedAt": "2024-01-02T03:04:05Z",
+        "additions": 1,
+        "deletions": 1,
+        "changedFiles": 1,
+        "commits": commits_page(["feat: a"], "c1"),
+    }
+    mock_github.requester.graphql_query.side_effect = [
+        ({}, {"data": {"repository": {"pr7": pull_request}}}),
+        ({}, {"data": {"repository": {"pullRequest": {"commits": commits_page(["fix: b"], "c2")}}}}),
+        ({}, {"data": {"repository": {"pullRequest": {"commits": commits_page(["test: c"], None)}}}}),
+    ]
+
+    client = GitHubPRClient("token")
+    details = client.get_pr_details("org/repo", [7])
+
+    assert details[7]["commit_messages"] == ["feat: a", "fix: b", "test: c"]
+    calls = mock_github.requester.graphql_query.call_args_list
+    assert "commits(first: 100)" in calls[0].args[0]
+    for call in calls:
+        query, _ = call.args
+        assert all(int(size) <= 100 for size in re.findall(r"first: (\d+)", query))
+    assert [call.args[1].get("cursor") for call in calls] == [None, "c1", "c2"]
+
+
+def test_pr_details_without_commits(mock_github_class, mock_pr):
+    """Commit messages are neither queried nor fetched when not wanted."""
+    mock_github = Mock()
+    mock_github_class.return_value = mock_github
+    pull_request = {
+        "merged": False,
+        "mergedAt": None,
+        "additions": 1,
+        "deletions": 0,
+        "changedFiles": 1,
+    }
+    mock_github.requester.graphql_query.return_value = (
+        {},
+        {"data": {"repository": {"pr1": pull_request}}},
+    )
+
+    client = GitHubPRClient("token")
+    details = client.get_pr_details("org/repo", [1], fetch_commits=False)
+
+    query, _ = mock_github.requester.graphql_query.call_args.args
+    assert "commits" not in query
+    assert details[1]["commit_messages"] == []
+
+    data = client.extract_pr_data(mock_pr, fetch_commits=False)
+    assert data["commit_messages"] == []
+    mock_pr.get_commits.assert_not_called()
@@ -4,11 +4,45 @@ import pytest
 import json
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 from github_pr_review.analyzer import PRAnalyzer
 from github_pr_review.report_generator import ReportGenerator
 
-
-@pytest.fixture
+# Expected keys of each section of the JSON output, so layout drift fails the test
+JSON_OUTPUT_KEYS = {
+    "metadata": {"organization", "user", "year", "generated_at"},
+    "summary": {
+        "total_prs",
+        "merged",
+        "closed_not_merged",
+        "open",
+        "avg_time_to_close_hours",
+        "median_time_to_close_hours",
+    },
+    "aggregated_metrics": {
+        "work_items",
+        "code_changes",
+        "conventional_commits",
+        "business_insights",
+        "monthly_breakdown",
+        "prs_by_author",
+        "prs_per_month",
+    },
+}
+
+# Expected keys of each repository entry in the JSON output
+JSON_REPOSITORY_KEYS = {
+    "total_prs",
+    "merged",
+    "work_items",
+    "code_changes",
+    "conventional_commits",
+    "prs_per_month",
+    "prs_by_author",
+}
+
+
+@pytest.fixture(scope="module")
 def sample_pr_data():
     """Sample PR data for testing."""
     return [
@@ -53,40 +87,74 @@ def sample_pr_data():
     ]
 
 
+@pytest.fixture(scope="module")
+def analyzer(sample_pr_data):
+    """Aggregated analyzer over the sample PRs, built once per module."""
+    return PRAnalyzer(sample_pr_data)
+
+
+@pytest.fixture(scope="module")
+def analyzer_by_repo(sample_pr_data):
+    """Per-repository analyzers over the sample PRs, built once per module."""
+    return {
+        "org/repo1": PRAnalyzer([sample_pr_data[0]]),
+        "org/repo2": PRAnalyzer([sample_pr_data[1]]),
+    }
+
+
+@pytest.fixture(scope="module")
+def monthly_data(analyzer):
+    """Monthly breakdown of the sample PRs."""
+    return analyzer.get_monthly_breakdown()
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """Report generator shared by the tests that don't depend on its state."""
+    return ReportGenerator("myorg", "testuser", 2024)
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path):
     """Create a temporary output directory."""
     return tmp_path / "reports"
 
 
-def test_format_time():
+@pytest.mark.parametrize(
+    "hours,expected",
+    [
+        (None, "N/A"),
+        (0.5, "30m"),
+        (2.5, "2h 30m"),
+        (25.0, "1d 1h"),
+        (50.5, "2d 2h"),
+        (24.0, "1d 0h"),
+        (1.0, "1h 0m"),
+    ],
+)
+def test_format_time(generator, hours, expected):
     """Test time formatting."""
-    generator = ReportGenerator("org", "user", 2024)
-
-    assert generator._format_time(None) == "N/A"
-    assert generator._format_time(0.5) == "30m"
-    assert generator._format_time(2.5) == "2h 30m"
-    assert generator._format_time(25.0) == "1d 1h"
-    assert generator._format_time(50.5) == "2d 2h"
+    assert generator._format_time(hours) == expected
 
 
-def test_format_currency():
+def test_format_currency(generator):
     """Test currency formatting."""
-    generator = ReportGenerator("org", "user", 2024)
-    
     assert generator._format_currency(1000) == "$1,000"
     assert generator._format_currency(1234567) == "$1,234,567"
 
 
-def test_generate_yearly_summary_aggregated(sample_pr_data, temp_output_dir):
-    """Test aggregated yearly summary generation."""
-    analyzer = PRAnalyzer(sample_pr_data)
-    analyzer_by_repo = {
-        "org/repo1": PRAnalyzer([sample_pr_data[0]]),
-        "org/repo2": PRAnalyzer([sample_pr_data[1]]),
-    }
-    generator = ReportGenerator("myorg", "testuser", 2024)
+def test_render_kv():
+    """Test labelled value block rendering."""
+    assert ReportGenerator._render_kv([("🔢", "Total PRs", 3), ("✅", "Merged", "2 (66.7%)")]) == (
+        "- 🔢 **Total PRs:** 3\n- ✅ **Merged:** 2 (66.7%)\n"
+    )
+    assert ReportGenerator._render_kv([("🔢", "Total PRs", 3)], " \n") == "- 🔢 **Total PRs:** 3 \n"
+
 
+def test_generate_yearly_summary_aggregated(
+    analyzer, analyzer_by_repo, temp_output_dir, generator
+):
+    """Test aggregated yearly summary generation."""
     output_path = temp_output_dir / "summary.md"
     generator.generate_yearly_summary_aggregated(analyzer, analyzer_by_repo, str(output_path))
 
@@ -103,17 +171,14 @@ def test_generate_yearly_summary_aggregated(sample_pr_data, temp_output_dir):
     assert "💰 Business Value & Cost Savings" in content
 
 
-def test_generate_yearly_summary_by_repo(sample_pr_data, temp_output_dir):
+def test_generate_yearly_summary_by_repo(
+    sample_pr_data, analyzer_by_repo, temp_output_dir, generator
+):
     """Test yearly summary by repository."""
     pr_data_by_repo = {
         "org/repo1": [sample_pr_data[0]],
         "org/repo2": [sample_pr_data[1]],
     }
-    analyzer_by_repo = {
-        "org/repo1": PRAnalyzer([sample_pr_data[0]]),
-        "org/repo2": PRAnalyzer([sample_pr_data[1]]),
-    }
-    generator = ReportGenerator("myorg", "testuser", 2024)
 
     output_path = temp_output_dir / "by_repo_summary.md"
     generator.generate_yearly_summary_by_repo(pr_data_by_repo, analyzer_by_repo, str(output_path))
@@ -127,12 +192,44 @@ def test_generate_yearly_summary_by_repo(sample_pr_data, temp_output_dir):
     assert "🏷️ Conventional Commits" in content
 
 
-def test_generate_monthly_breakdown_aggregated(sample_pr_data, temp_output_dir):
-    """Test aggregated monthly breakdown generation."""
-    analyzer = PRAnalyzer(sample_pr_data)
-    monthly_data = analyzer.get_monthly_breakdown()
-    generator = ReportGenerator("myorg", "testuser", 2024)
+def test_generate_yearly_summary_by_repo_section_golden(
+    sample_pr_data, analyzer_by_repo, temp_output_dir, generator
+):
+    """Test a repository section of the by-repo summary line for line."""
+    output_path = temp_output_dir / "by_repo_summary.md"
+    generator.generate_yearly_summary_by_repo(
+        {"org/repo1": [sample_pr_data[0]]},
+        {"org/repo1": analyzer_by_repo["org/repo1"]},
+        str(output_path),
+    )
 
+    section = output_path.read_text().split("## 📦 org/repo1\n\n", 1)[1]
+    # The work item and code change lines keep their trailing space
+    assert section == (
+        "### 📊 Summary Statistics\n\n"
+        "- 🔢 **Total PRs:** 1\n"
+        "- ✅ **Merged:** 1\n"
+        "- ❌ **Closed (not merged):** 0\n"
+        "- 🔓 **Still Open:** 0\n"
+        "- ⏰ **Average Time to Close:** 1d 4h\n\n"
+        "### 🏷️ Conventional Commits\n\n"
+        "- 📝 **PRs with Conventional Commits:** 1 (100.0%)\n"
+        "- **Commit Type Breakdown:**\n"
+        "  - `✨ feat`: 2\n\n"
+        "### 🔗 Work Items\n\n"
+        "- 🔖 **GitHub Issues Referenced:** 1 \n"
+        "- 📋 **Jira Tickets Referenced:** 0 \n"
+        "- ✅ **PRs with Work Items:** 1 (100.0%) \n\n"
+        "### 💻 Code Changes\n\n"
+        "- ➕ **Total Lines Added:** 100 \n"
+        "- ➖ **Total Lines Deleted:** 20 \n"
+        "- 📄 **Total Files Changed:** 5 \n\n"
+        "---\n\n"
+    )
+
+
+def test_generate_monthly_breakdown_aggregated(monthly_data, temp_output_dir, generator):
+    """Test aggregated monthly breakdown generation."""
     output_path = temp_output_dir / "monthly.md"
     generator.generate_monthly_breakdown_aggregated(monthly_data, str(output_path))
 
@@ -145,49 +242,80 @@ def test_generate_monthly_breakdown_aggregated(sample_pr_data, temp_output_dir):
     assert "February 2024" in content
 
 
-def test_generate_json_output(sample_pr_data, temp_output_dir):
+def test_generate_json_output(
+    sample_pr_data, analyzer, analyzer_by_repo, temp_output_dir, generator
+):
     """Test JSON output generation."""
     pr_data_by_repo = {
         "org/repo1": [sample_pr_data[0]],
         "org/repo2": [sample_pr_data[1]],
     }
-    analyzer_by_repo = {
-        "org/repo1": PRAnalyzer([sample_pr_data[0]]),
-        "org/repo2": PRAnalyzer([sample_pr_data[1]]),
-    }
-    aggregated_analyzer = PRAnalyzer(sample_pr_data)
-    generator = ReportGenerator("myorg", "testuser", 2024)
 
     output_path = temp_output_dir / "data.json"
     generator.generate_json_output(
-        pr_data_by_repo, analyzer_by_repo, aggregated_analyzer, str(output_path)
+        pr_data_by_repo, analyzer_by_repo, analyzer, str(output_path)
     )
 
     assert output_path.exists()
     
     # Load and validate JSON
-    with open(output_path) as f:
-        data = json.load(f)
-    
+    data = json.loads(output_path.read_text())
+
+    assert data.keys() == {*JSON_OUTPUT_KEYS, "repositories"}
+    for section, keys in JSON_OUTPUT_KEYS.items():
+        assert data[section].keys() == keys
+    assert data["repositories"].keys() == {"org/repo1", "org/repo2"}
+    for repo in data["repositories"].values():
+        assert repo.keys() == JSON_REPOSITORY_KEYS
+
     assert data["metadata"]["organization"] == "myorg"
     assert data["metadata"]["user"] == "testuser"
     assert data["metadata"]["year"] == 2024
     assert data["summary"]["total_prs"] == 2
-    assert "repositories" in data
-    assert "aggregated_metrics" in data
 
 
-def test_reports_create_directory_if_not_exists(sample_pr_data, temp_output_dir):
+def test_reports_create_directory_if_not_exists(
+    analyzer, analyzer_by_repo, temp_output_dir, generator
+):
     """Test that directories are created if they don't exist."""
-    analyzer = PRAnalyzer(sample_pr_data)
-    analyzer_by_repo = {
-        "org/repo1": PRAnalyzer([sample_pr_data[0]]),
-        "org/repo2": PRAnalyzer([sample_pr_data[1]]),
-    }
-    generator = ReportGenerator("myorg", "testuser", 2024)
-
     nested_path = temp_output_dir / "nested" / "path" / "summary.md"
     generator.generate_yearly_summary_aggregated(analyzer, analyzer_by_repo, str(nested_path))
 
     assert nested_path.exists()
     assert nested_path.parent.exists()
+
+
+def test_reports_create_shared_directory_once(analyzer, monthly_data, temp_output_dir):
+    """Reports written to the same directory only create it once."""
+    generator = ReportGenerator("myorg", "testuser", 2024)
+    temp_output_dir.mkdir(parents=True, exist_ok=True)
+
+    with patch.object(Path, "mkdir", autospec=True) as mock_mkdir:
+        generator.generate_yearly_summary_aggregated(analyzer, {}, str(temp_output_dir / "a.md"))
+        generator.generate_monthly_breakdown_aggregated(
+            monthly_data, str(temp_output_dir / "b.md")
+        )
+
+    mock_mkdir.assert_called_once_with(temp_output_dir, parents=True, exist_ok=True)
+    assert (temp_output_dir / "a.md").exists()
+    assert (temp_output_dir / "b.md").exists()
+
+
+def test_monthly_breakdown_by_repo_skips_empty_sections(monthly_data, temp_output_dir, generator):
+    """Repositories and months without PRs are left out of the breakdown."""
+    empty_month = dict(next(iter(monthly_data.values())), total_prs=0)
+
+    output_path = temp_output_dir / "monthly_by_repo.md"
+    generator.generate_monthly_breakdown_by_repo(
+        {
+            "org/active": {**monthly_data, "2024-03": empty_month},
+            "org/idle": {},
+        },
+        str(output_path),
+    )
+
+    content = output_path.read_text()
+    assert "org/active" in content
+    assert "January 2024" in content
+    assert "March 2024" not in content
+    assert "org/idle" not in content